@@ -186,6 +186,15 @@ COVALENT_API_KEY = config("COVALENT_API_KEY", cast=str)
 REDIS_URL = config("REDIS_URL", cast=str)
 
 
+# cache shared by all web processes, so cache invalidation reaches them all
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    }
+}
+
+
 # alchemy configuration
 ALCHEMY_HTTPS_URL = config("ALCHEMY_HTTPS_URL", cast=str)
 ALCHEMY_WH_SIGNING_KEY = config("ALCHEMY_WH_SIGNING_KEY", cast=str)
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class AppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'blockso_app'
+
+    def ready(self):
+        """ Connects the application's signal receivers. """
+
+        from . import signals  # noqa: F401
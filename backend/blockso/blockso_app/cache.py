@@ -0,0 +1,82 @@
+"""
+Module containing helpers for caching API responses.
+"""
+# std lib imports
+import time
+
+# third party imports
+from django.core.cache import cache
+from rest_framework.response import Response
+
+# our imports
+
+
+PROFILE_LIST_PREFIX = "profile_list"
+PROFILE_LIST_TIMEOUT = 30  # seconds
+
+
+def _generation_key(prefix):
+    """ Returns the cache key holding the generation of the given prefix. """
+
+    return f"{prefix}:generation"
+
+
+def get_generation(prefix):
+    """
+    Returns the current generation of the responses cached under
+    the given prefix. Every cache key built for the prefix contains
+    the generation, so bumping it orphans all previously cached
+    responses. A missing generation is seeded from the clock so that
+    an evicted generation never maps back onto old keys.
+    """
+    return cache.get_or_set(_generation_key(prefix), time.time_ns(), None)
+
+
+def invalidate(prefix):
+    """ Invalidates all the responses cached under the given prefix. """
+
+    try:
+        cache.incr(_generation_key(prefix))
+    except ValueError:
+        # generation is not set, so nothing is cached under it
+        pass
+
+
+def get_response_key(prefix, request):
+    """
+    Returns the key used to cache the response to the given request,
+    which is unique per requestor and absolute url (including query).
+    The url includes the scheme and host since the cached pagination
+    links are absolute.
+    """
+    generation = get_generation(prefix)
+    url = request.build_absolute_uri()
+
+    return f"{prefix}:{generation}:{request.user.pk}:{url}"
+
+
+class CachedListMixin:
+    """
+    Mixin for list views that caches the listed data for a short time.
+    Cached data is invalidated whenever the data it was built from
+    changes, see signals.py.
+    """
+
+    cache_prefix = PROFILE_LIST_PREFIX
+    cache_timeout = PROFILE_LIST_TIMEOUT
+
+    def list(self, request, *args, **kwargs):
+        """ Returns the cached list if there is one, else caches it. """
+
+        key = get_response_key(self.cache_prefix, request)
+
+        # return the cached data
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        # build the response and cache its data
+        response = super().list(request, *args, **kwargs)
+        cache.set(key, response.data, self.cache_timeout)
+
+        return response
@@ -0,0 +1,19 @@
+# Generated by Django 4.1.1 on 2026-10-15 05:43
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blockso_app', '0011_alter_feed_options_remove_feed_profiles_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='post',
+            name='created',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
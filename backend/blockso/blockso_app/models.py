@@ -3,6 +3,7 @@
 # third party imports
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 # our imports
 from .web3_client import w3
@@ -204,7 +205,9 @@ class Post(models.Model):
         null=True,
         blank=False
     )
-    created = models.DateTimeField(blank=False)
+    # default instead of auto_now_add so that posts created from
+    # transactions can still be given the transaction's timestamp
+    created = models.DateTimeField(blank=False, default=timezone.now)
 
 
 class PostLike(models.Model):
@@ -1,12 +1,17 @@
 # std lib imports
-from datetime import datetime, timezone
+from collections import OrderedDict
+from copy import copy, deepcopy
 
 # third party imports
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.auth import get_user_model
-from rest_framework.fields import ModelField
+from django.db import models, transaction
+from django.db.models import Count, Exists, IntegerField, OuterRef, \
+        Prefetch, Subquery, Value
+from django.db.models.functions import Coalesce
+from rest_framework.fields import ModelField, SkipField
+from rest_framework.relations import ManyRelatedField, PKOnlyObject
 from rest_framework import serializers
-from web3 import Web3
 
 # our imports
 from .models import Comment, CommentLike, CommentOnPostEvent, ERC20Transfer, \
@@ -14,14 +19,148 @@ from .models import Comment, CommentLike, CommentOnPostEvent, ERC20Transfer, \
         LikedPostEvent, MentionedInCommentEvent, MentionedInPostEvent, \
         Notification, Post, PostLike, Profile, RepostEvent, Socials, \
         Transaction
-from . import alchemy
+from . import alchemy, utils
 
 
 UserModel = get_user_model()
 TaggedEveryone = "everyone"
 
 
-class SocialsSerializer(serializers.ModelSerializer):
+def related_count(model, field):
+    """
+    Returns a subquery expression counting the rows of the given model
+    whose given field points at the outer queryset's row. Unlike Count
+    this does not add a join or a GROUP BY to the outer queryset.
+    """
+    rows = model.objects.filter(**{field: OuterRef("pk")})
+    rows = rows.order_by().values(field)
+    rows = rows.annotate(count=Count("pk")).values("count")
+
+    return Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+
+
+class CachedFieldsSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that builds its fields once per class and hands
+    each instance copies of them, instead of re-running the model
+    introspection and deep copy in get_fields for every instance.
+    Also keeps the readable fields of an instance, see _readable_fields.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        """ Returns copies of the cached fields of the serializer class. """
+
+        # build the fields the first time the class is used
+        cls = self.__class__
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+
+        # nested serializers and many related fields hold child fields
+        # that get bound to their parent, so those need their own copy
+        fields = {}
+        for name, field in self._fields_cache[cls].items():
+            if isinstance(field, (serializers.BaseSerializer, ManyRelatedField)):
+                fields[name] = deepcopy(field)
+            else:
+                fields[name] = copy(field)
+
+        return fields
+
+    @property
+    def _readable_fields(self):
+        """
+        Returns the fields that are serialized when reading.
+        DRF re-filters all the fields for every object serialized;
+        this computes them once per serializer instance, which for
+        many=True is the child shared by every object in the list.
+        """
+        readable = self.__dict__.get("_readable_fields_cache")
+        if readable is None:
+            readable = tuple(
+                field for field in self.fields.values()
+                if not field.write_only
+            )
+            self._readable_fields_cache = readable
+
+        return readable
+
+
+class FastReadOnlySerializer(CachedFieldsSerializer):
+    """
+    Read only model serializer whose to_representation copies plain
+    model attributes (text, numbers, booleans) straight off the
+    instance, skipping DRF's per field get_attribute/to_representation
+    calls. Fields that convert their value (dates, nested serializers)
+    still go through the field.
+    """
+
+    _plain_field_types = (
+        serializers.BooleanField,
+        serializers.CharField,
+        serializers.IntegerField
+    )
+
+    def _get_representation_plan(self):
+        """
+        Returns a list of (field name, field or None) pairs for the
+        readable fields, where None marks a plain attribute.
+        Built once per serializer instance, which for many=True is the
+        child shared by every row.
+        """
+        plan = self.__dict__.get("_representation_plan")
+        if plan is None:
+            plan = []
+            for field in self._readable_fields:
+                plain = isinstance(field, self._plain_field_types) and \
+                    field.source_attrs == [field.field_name]
+                plan.append((field.field_name, None if plain else field))
+            self._representation_plan = plan
+
+        return plan
+
+    def get_precomputed_values(self, instance):
+        """
+        Returns a dict of field name to value for fields whose values
+        were computed ahead of time, e.g. in bulk for a whole list.
+        Those fields are not read from the instance.
+        """
+        return {}
+
+    def to_representation(self, instance):
+        """ Object instance -> Dict of primitive datatypes. """
+
+        precomputed = self.get_precomputed_values(instance)
+
+        ret = OrderedDict()
+        for field_name, field in self._get_representation_plan():
+            # use values computed ahead of time
+            if field_name in precomputed:
+                ret[field_name] = precomputed[field_name]
+                continue
+
+            # plain attributes are already primitive
+            if field is None:
+                ret[field_name] = getattr(instance, field_name)
+                continue
+
+            try:
+                attribute = field.get_attribute(instance)
+            except SkipField:
+                continue
+
+            check_for_none = attribute.pk \
+                if isinstance(attribute, PKOnlyObject) else attribute
+            if check_for_none is None:
+                ret[field_name] = None
+            else:
+                ret[field_name] = field.to_representation(attribute)
+
+        return ret
+
+
+class SocialsSerializer(CachedFieldsSerializer):
     """ Socials model serializer. """
 
     class Meta:
@@ -30,7 +169,7 @@ class SocialsSerializer(serializers.ModelSerializer):
                   "looksrare", "snapshot"]
 
 
-class ProfileSerializer(serializers.ModelSerializer):
+class ProfileSerializer(CachedFieldsSerializer):
     """ Profile model serializer. """
 
     class Meta:
@@ -39,27 +178,71 @@ class ProfileSerializer(serializers.ModelSerializer):
                   "numFollowing", "followedByMe", "lastLogin"]
 
     socials = SocialsSerializer()
-    address = serializers.SerializerMethodField("get_address")
+    address = serializers.CharField(
+        source="user.ethereum_address",
+        read_only=True
+    )
     numFollowers = serializers.SerializerMethodField("get_num_followers")
     numFollowing = serializers.SerializerMethodField("get_num_following")
     followedByMe = serializers.SerializerMethodField("get_followed_by_me")
     lastLogin = serializers.SerializerMethodField("get_last_login")
 
-    def get_address(self, obj):
-        """ Returns the address of the User associated with the Profile. """
+    @staticmethod
+    def setup_eager_loading(queryset, request=None):
+        """
+        Returns the given Profile queryset with the user and socials
+        joined (only the serialized columns), and the follower/following
+        counts and followed by requestor flag annotated, so serializing
+        a list of profiles does not issue per profile queries.
+        """
+        # join the user and socials rows, only loading serialized columns
+        queryset = queryset.select_related("user", "socials")
+        queryset = queryset.only(
+            "bio",
+            "image",
+            "user__ethereum_address",
+            "user__last_login",
+            "socials__profile",
+            *[f"socials__{name}" for name in SocialsSerializer.Meta.fields]
+        )
+
+        # annotate the follow counts using subqueries so they do not
+        # interact with any joins used to filter/order the queryset
+        queryset = queryset.annotate(
+            num_followers=related_count(Follow, "dest"),
+            num_following=related_count(Follow, "src")
+        )
+
+        # annotate whether the authed user follows each profile
+        authed_user = None
+        if request is not None:
+            authed_user = getattr(request.user, "profile", None)
+        if authed_user is not None:
+            queryset = queryset.annotate(
+                followed_by_me=Exists(
+                    Follow.objects.filter(src=authed_user, dest=OuterRef("pk"))
+                )
+            )
 
-        user = getattr(obj, "user")
-        return user.ethereum_address
+        return queryset
 
     def get_num_followers(self, obj):
         """ Returns the profile's follower count. """
 
+        # use the annotated count if the queryset was eager loaded
+        if hasattr(obj, "num_followers"):
+            return obj.num_followers
+
         followers = obj.follow_dest.all()
         return followers.count() 
 
     def get_num_following(self, obj):
         """ Returns the profile's following count. """
 
+        # use the annotated count if the queryset was eager loaded
+        if hasattr(obj, "num_following"):
+            return obj.num_following
+
         following = obj.follow_src.all()
         return following.count() 
 
@@ -77,6 +260,10 @@ class ProfileSerializer(serializers.ModelSerializer):
         if authed_user is None:
             return False
 
+        # use the annotated flag if the queryset was eager loaded
+        if hasattr(obj, "followed_by_me"):
+            return obj.followed_by_me
+
         # check if authed user follows the profile
         return Follow.objects.filter(src=authed_user, dest=obj).exists()
 
@@ -90,7 +277,10 @@ class ProfileSerializer(serializers.ModelSerializer):
 
         # get address from the URL
         address = self.context.get("view").kwargs["address"].lower()
-        address = Web3.toChecksumAddress(address)
+        try:
+            address = utils.to_checksum_address(address)
+        except ValueError:
+            raise serializers.ValidationError("Invalid address.")
         
         # create User, Socials, Profile
         user, _ = UserModel.objects.get_or_create(pk=address)
@@ -119,7 +309,7 @@ class ProfileSerializer(serializers.ModelSerializer):
         return instance
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsSerializer):
     """ User model serializer. """
 
     class Meta:
@@ -127,21 +317,16 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ["address", "profile"]
 
     profile = ProfileSerializer()
-    address = serializers.SerializerMethodField("get_address")
+    address = serializers.CharField(source="ethereum_address", read_only=True)
 
-    def get_address(self, obj):
-        """ Returns the address of the User. """
 
-        return obj.ethereum_address
-
-
-class FollowSerializer(serializers.ModelSerializer):
-    """ Follow model serializer. """
-
-    class Meta:
-        model = Follow
-        exclude = ["src", "dest"]
+class FollowSerializer(serializers.Serializer):
+    """
+    Follow serializer. Follows are made from the session and url only,
+    so this is a plain serializer rather than a model serializer.
+    """
 
+    id = serializers.IntegerField(read_only=True)
 
     def create(self, validated_data):
         """ Creates a Follow. """
@@ -152,17 +337,23 @@ class FollowSerializer(serializers.ModelSerializer):
 
         # get address from the URL
         address = self.context.get("view").kwargs["address"]
-        address = Web3.toChecksumAddress(address)
-        to_follow = Profile.objects.get(user_id=address)
+        try:
+            address = utils.to_checksum_address(address)
+        except ValueError:
+            raise serializers.ValidationError("Invalid address.")
+
+        # only the id of the profile to follow is needed
+        to_follow_id = Profile.objects.values_list("id", flat=True)\
+            .get(user_id=address)
 
         # signed in user follows the address given in the url
         follow = Follow.objects.create(
             src=user,
-            dest=to_follow
+            dest_id=to_follow_id
         )
 
         # notify the user that was followed
-        notif = Notification.objects.create(user=to_follow)
+        notif = Notification.objects.create(user_id=to_follow_id)
         FollowedEvent.objects.create(
             notification=notif,
             follow=follow,
@@ -184,7 +375,7 @@ class FeedImageSerializer(serializers.Serializer):
     image = serializers.FileField()
 
 
-class FeedSerializer(serializers.ModelSerializer):
+class FeedSerializer(CachedFieldsSerializer):
     """ Feed model serializer. """
 
     class Meta:
@@ -246,7 +437,7 @@ class FeedSerializer(serializers.ModelSerializer):
         return feed
 
 
-class ERC20TransferSerializer(serializers.ModelSerializer):
+class ERC20TransferSerializer(FastReadOnlySerializer):
     """ ERC20Transfer model serializer. """
 
     class Meta:
@@ -257,7 +448,7 @@ class ERC20TransferSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class ERC721TransferSerializer(serializers.ModelSerializer):
+class ERC721TransferSerializer(FastReadOnlySerializer):
     """ ERC721Transfer model serializer. """
 
     class Meta:
@@ -267,7 +458,7 @@ class ERC721TransferSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class TransactionSerializer(serializers.ModelSerializer):
+class TransactionSerializer(FastReadOnlySerializer):
     """ Transaction model serializer. """
 
     class Meta:
@@ -276,24 +467,25 @@ class TransactionSerializer(serializers.ModelSerializer):
                 "to_address", "value", "erc20_transfers", "erc721_transfers"]
         read_only_fields = fields
 
-    erc20_transfers = serializers.SerializerMethodField()
-    erc721_transfers = serializers.SerializerMethodField()
+    erc20_transfers = ERC20TransferSerializer(many=True, read_only=True)
+    erc721_transfers = ERC721TransferSerializer(many=True, read_only=True)
 
-    def get_erc20_transfers(self, instance):
+    def get_precomputed_values(self, instance):
         """
-        Return a list serializer of all the ERC20 transfers
-        associated with the transaction.
+        Returns the transaction's transfers if they were fetched
+        for a whole list of posts, see PostListSerializer.
+        Transactions that were not fetched, e.g. those of deeply
+        nested posts, are serialized through the declared fields.
         """
-        transfers = instance.erc20_transfers.all()
-        return ERC20TransferSerializer(transfers, many=True).data
+        tx_transfers = self.context.get("tx_transfers")
+        if tx_transfers is None:
+            return {}
 
-    def get_erc721_transfers(self, instance):
-        """
-        Return a list serializer of all the ERC721 transfers
-        associated with the transaction.
-        """
-        transfers = instance.erc721_transfers.all()
-        return ERC721TransferSerializer(transfers, many=True).data
+        return {
+            field_name: transfers[instance.id]
+            for field_name, transfers in tx_transfers.items()
+            if instance.id in transfers
+        }
 
 
 class TaggedUsersField(serializers.RelatedField):
@@ -309,7 +501,7 @@ class TaggedUsersField(serializers.RelatedField):
             return TaggedEveryone
 
         # return profile representing the tagged user
-        address = Web3.toChecksumAddress(data)
+        address = utils.to_checksum_address(data)
         return Profile.objects.get(user_id=address)
 
     def to_representation(self, value):
@@ -333,17 +525,83 @@ class RefPostField(serializers.RelatedField):
     def to_representation(self, value):
         """ Does serialization, for reading. """
 
-        # pass context through to nested serializer
-        serializer_context = {'request': self.context.get('request')}
+        # pass context through to nested serializer, including the
+        # transfers fetched for a whole list, see PostListSerializer
+        serializer_context = {
+            'request': self.context.get('request'),
+            'tx_transfers': self.context.get('tx_transfers'),
+            'tx_serializer': self.context.get('tx_serializer')
+        }
 
         return PostSerializer(value, context=serializer_context).data
 
 
-class PostSerializer(serializers.ModelSerializer):
+def get_transfers_by_tx(serializer_class, tx_ids):
+    """
+    Returns a dict of transaction id to the serialized transfers of
+    that transaction, for the given transfer serializer class.
+    Reads only the serialized columns as dicts instead of building
+    model instances. The serialized fields are plain columns, so the
+    dicts are already what the serializer would produce.
+    Every given transaction has an entry, even without transfers.
+    """
+    fields = serializer_class.Meta.fields
+    rows = serializer_class.Meta.model.objects.filter(tx_id__in=tx_ids)
+    rows = rows.order_by("pk").values("tx_id", *fields)
+
+    # group the transfers by transaction
+    transfers = {tx_id: [] for tx_id in tx_ids}
+    for row in rows:
+        transfers[row.pop("tx_id")].append(row)
+
+    return transfers
+
+
+class PostListSerializer(serializers.ListSerializer):
+    """
+    List serializer for Posts that fetches the transfers of all the
+    listed posts' transactions in bulk, instead of per transaction,
+    and serializes all the transactions with a single serializer.
+    """
+
+    def to_representation(self, data):
+        """ List of object instances -> List of dicts of primitives. """
+
+        # evaluate the posts
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        posts = list(iterable)
+
+        # fetch the transfers of the transactions referenced by the posts
+        # and by the posts they repost or quote
+        tx_ids = {post.refTx_id for post in posts if post.refTx_id}
+        tx_ids.update(
+            post.refPost.refTx_id for post in posts
+            if post.refPost_id and post.refPost.refTx_id
+        )
+        tx_transfers = {}
+        if tx_ids:
+            tx_transfers["erc20_transfers"] = get_transfers_by_tx(
+                ERC20TransferSerializer,
+                tx_ids
+            )
+            tx_transfers["erc721_transfers"] = get_transfers_by_tx(
+                ERC721TransferSerializer,
+                tx_ids
+            )
+        self.context["tx_transfers"] = tx_transfers
+        self.context["tx_serializer"] = TransactionSerializer(
+            context=self.context
+        )
+
+        return [self.child.to_representation(post) for post in posts]
+
+
+class PostSerializer(CachedFieldsSerializer):
     """ Post model serializer. """
 
     class Meta:
         model = Post
+        list_serializer_class = PostListSerializer
         fields = ["id", "author", "text", "imgUrl", "isShare", "isQuote",
                   "refPost", "refTx", "numComments", "created", "tagged_users",
                   "numReposts", "repostedByMe", "numLikes", "likedByMe"]
@@ -367,19 +625,88 @@ class PostSerializer(serializers.ModelSerializer):
         write_only=True
     )
 
+    @staticmethod
+    def setup_eager_loading(queryset, request=None, ref_posts=True):
+        """
+        Returns the given Post queryset with the authors (eager loaded
+        like any listed profile), the referenced transaction and the
+        referenced post loaded up front, and the comment, like and
+        repost counts and the requestor's like/repost flags annotated,
+        so serializing a list of posts does not issue per post queries.
+        The transaction's transfers are fetched in bulk when listing,
+        see PostListSerializer. Referenced posts are eager loaded one
+        level deep, i.e. without their own referenced posts.
+        """
+        # join the referenced transaction
+        queryset = queryset.select_related("refTx")
+
+        # prefetch the authors
+        authors = ProfileSerializer.setup_eager_loading(
+            Profile.objects.all(),
+            request
+        )
+        queryset = queryset.prefetch_related(
+            Prefetch("author", queryset=authors)
+        )
+
+        # prefetch the referenced posts
+        if ref_posts:
+            posts = PostSerializer.setup_eager_loading(
+                Post.objects.all(),
+                request,
+                ref_posts=False
+            )
+            queryset = queryset.prefetch_related(
+                Prefetch("refPost", queryset=posts)
+            )
+
+        # annotate the counts
+        queryset = queryset.annotate(
+            num_comments=related_count(Comment, "post"),
+            num_likes=related_count(PostLike, "post"),
+            num_reposts=related_count(Post, "refPost")
+        )
+
+        # annotate whether the authed user liked/reposted each post
+        authed_user = None
+        if request is not None:
+            authed_user = getattr(request.user, "profile", None)
+        if authed_user is not None:
+            queryset = queryset.annotate(
+                liked_by_me=Exists(PostLike.objects.filter(
+                    post=OuterRef("pk"),
+                    liker=authed_user
+                )),
+                reposted_by_me=Exists(Post.objects.filter(
+                    refPost=OuterRef("pk"),
+                    isShare=True,
+                    author=authed_user
+                ))
+            )
+
+        return queryset
+
     def get_refTx(self, instance):
         """ Return serialized transaction that the post refers to. """
 
-        if instance.refTx is not None:
-            return TransactionSerializer(
-                Transaction.objects.get(pk=instance.refTx.id)
-            ).data
+        # check the fk column so a post without a tx never joins
+        if instance.refTx_id is None:
+            return None
+
+        # reuse the serializer shared by a whole list, see PostListSerializer
+        tx_serializer = self.context.get("tx_serializer")
+        if tx_serializer is None:
+            tx_serializer = TransactionSerializer(context=self.context)
 
-        return None
+        return tx_serializer.to_representation(instance.refTx)
 
     def get_numLikes(self, instance):
         """ Returns number of likes on the post. """
 
+        # use the annotated count if the queryset was eager loaded
+        if hasattr(instance, "num_likes"):
+            return instance.num_likes
+
         return instance.likes.count()
 
     def get_likedByMe(self, instance):
@@ -394,17 +721,29 @@ class PostSerializer(serializers.ModelSerializer):
         if isinstance(request.user, AnonymousUser):
             return False
 
+        # use the annotated flag if the queryset was eager loaded
+        if hasattr(instance, "liked_by_me"):
+            return instance.liked_by_me
+
         user = request.user.profile
         return instance.likes.filter(liker=user).exists()
 
     def get_numComments(self, instance):
         """ Returns number of comments on the post. """
 
+        # use the annotated count if the queryset was eager loaded
+        if hasattr(instance, "num_comments"):
+            return instance.num_comments
+
         return instance.comments.count()
 
     def get_numReposts(self, instance):
         """ Returns number of reposts for the post. """
 
+        # use the annotated count if the queryset was eager loaded
+        if hasattr(instance, "num_reposts"):
+            return instance.num_reposts
+
         return Post.objects.filter(refPost=instance).count()
 
     def get_repostedByMe(self, instance):
@@ -419,13 +758,17 @@ class PostSerializer(serializers.ModelSerializer):
         if isinstance(request.user, AnonymousUser):
             return False
 
+        # use the annotated flag if the queryset was eager loaded
+        if hasattr(instance, "reposted_by_me"):
+            return instance.reposted_by_me
+
         return Post.objects.filter(
             refPost_id=instance.id,
             isShare=True,
             author=request.user.profile
         ).exists()
 
-    def _handle_repost(self, author, created, ref_post):
+    def _handle_repost(self, author, ref_post):
         """
         Creates a repost and notifies the appropriate parties.
         Returns the created repost.
@@ -444,7 +787,6 @@ class PostSerializer(serializers.ModelSerializer):
 
         post = Post.objects.create(
             author=author,
-            created=created,
             refPost=ref_post,
             isShare=True,
             isQuote=False,
@@ -466,7 +808,6 @@ class PostSerializer(serializers.ModelSerializer):
 
         # get user from the session
         author = self.context.get("request").user.profile
-        created = datetime.now(timezone.utc)
         ref_post = validated_data.pop("refPost")
 
         # handle reposts
@@ -475,7 +816,6 @@ class PostSerializer(serializers.ModelSerializer):
 
             return self._handle_repost(
                 author,
-                created,
                 ref_post
             )
 
@@ -484,12 +824,10 @@ class PostSerializer(serializers.ModelSerializer):
         # extract any tagged users
         tagged_users = validated_data.pop("tagged_users")
 
-        # create Post
-        post = Post.objects.create(
-            author=author,
-            created=created,
-            **validated_data
-        )
+        # create Post with a single INSERT ... RETURNING, skipping the
+        # save() machinery, there are no Post signals that need to fire
+        post = Post(author=author, **validated_data)
+        Post.objects.bulk_create([post])
 
         # set tagged users
         # if everyone is tagged then tag all active users minus post author
@@ -499,7 +837,6 @@ class PostSerializer(serializers.ModelSerializer):
                 .exclude(id=author.id)
 
         post.tagged_users.set(tagged_users)
-        post.save()
 
         # create a notifications for the tagged users
         for profile in tagged_users:
@@ -545,7 +882,7 @@ class PostSerializer(serializers.ModelSerializer):
         return instance
 
 
-class PostLikeSerializer(serializers.ModelSerializer):
+class PostLikeSerializer(CachedFieldsSerializer):
     """ PostLike model serializer. """
 
     class Meta:
@@ -594,7 +931,7 @@ class RepostSerializer(serializers.ModelSerializer):
         model = Post
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(CachedFieldsSerializer):
     """ Comment model serializer. """
 
     class Meta:
@@ -614,6 +951,13 @@ class CommentSerializer(serializers.ModelSerializer):
     numLikes = serializers.SerializerMethodField()
     likedByMe = serializers.SerializerMethodField()
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Returns the given Comment queryset with the
+        author's user and socials loaded up front.
+        """
+        return queryset.select_related("author__user", "author__socials")
 
     def get_numLikes(self, instance):
         """ Returns number of likes on the comment. """
@@ -641,10 +985,11 @@ class CommentSerializer(serializers.ModelSerializer):
         # get user from the session
         author = self.context.get("request").user.profile
 
-        # get post id from the url
-        post = Post.objects.get(
-            pk=self.context.get("view").kwargs["post_id"]
-        )
+        # get post id from the url, and the post author for notifying
+        # them, without loading the whole post
+        post_id = self.context.get("view").kwargs["post_id"]
+        post_author_id = Post.objects.values_list("author_id", flat=True)\
+            .get(pk=post_id)
 
         # extract any tagged users
         tagged_users = validated_data.pop("tagged_users")
@@ -655,38 +1000,40 @@ class CommentSerializer(serializers.ModelSerializer):
                 .exclude(user__last_login=None)\
                 .exclude(id=author.id)
 
-        # create Comment
-        comment = Comment.objects.create(
-            author=author,
-            post=post,
-            **validated_data
-        )
+        with transaction.atomic():
+            # create Comment
+            comment = Comment.objects.create(
+                author=author,
+                post_id=post_id,
+                **validated_data
+            )
 
-        comment.tagged_users.set(tagged_users)
-        comment.save()
+            # tag users, the comment is new so there is nothing to diff
+            if tagged_users:
+                comment.tagged_users.add(*tagged_users)
 
-        # create a notification for the post author
-        notif = Notification.objects.create(user=post.author)
-        CommentOnPostEvent.objects.create(
-            notification=notif,
-            comment=comment,
-            post=post,
-            commentor=author
-        )
-
-        # create a notifications for the tagged users
-        for profile in tagged_users:
-            notif = Notification.objects.create(user=profile)
-            MentionedInCommentEvent.objects.create(
+            # create a notification for the post author
+            notif = Notification.objects.create(user_id=post_author_id)
+            CommentOnPostEvent.objects.create(
                 notification=notif,
                 comment=comment,
-                mentioned_by=author
+                post_id=post_id,
+                commentor=author
             )
 
+            # create a notifications for the tagged users
+            for profile in tagged_users:
+                notif = Notification.objects.create(user=profile)
+                MentionedInCommentEvent.objects.create(
+                    notification=notif,
+                    comment=comment,
+                    mentioned_by=author
+                )
+
         return comment
 
 
-class CommentLikeSerializer(serializers.ModelSerializer):
+class CommentLikeSerializer(CachedFieldsSerializer):
     """ CommentLike model serializer. """
 
     class Meta:
@@ -728,7 +1075,7 @@ class CommentLikeSerializer(serializers.ModelSerializer):
         return like
 
 
-class MentionedInPostEventSerializer(serializers.ModelSerializer):
+class MentionedInPostEventSerializer(CachedFieldsSerializer):
     """ MentionedInPostEvent model serializer. """
 
     class Meta:
@@ -744,7 +1091,7 @@ class MentionedInPostEventSerializer(serializers.ModelSerializer):
         return ProfileSerializer(obj.mentioned_by).data
 
 
-class MentionedInCommentEventSerializer(serializers.ModelSerializer):
+class MentionedInCommentEventSerializer(CachedFieldsSerializer):
     """ MentionedInCommentEvent model serializer. """
 
     class Meta:
@@ -767,7 +1114,7 @@ class MentionedInCommentEventSerializer(serializers.ModelSerializer):
         return obj.comment.post_id
 
 
-class CommentOnPostEventSerializer(serializers.ModelSerializer):
+class CommentOnPostEventSerializer(CachedFieldsSerializer):
     """ CommentOnPostEvent model serializer. """
 
     class Meta:
@@ -778,7 +1125,7 @@ class CommentOnPostEventSerializer(serializers.ModelSerializer):
     commentor = ProfileSerializer()
 
 
-class FollowedEventSerializer(serializers.ModelSerializer):
+class FollowedEventSerializer(CachedFieldsSerializer):
     """ FollowedEvent model serializer. """
 
     class Meta:
@@ -795,7 +1142,7 @@ class FollowedEventSerializer(serializers.ModelSerializer):
         return ProfileSerializer(obj.followed_by).data
 
 
-class LikedCommentEventSerializer(serializers.ModelSerializer):
+class LikedCommentEventSerializer(CachedFieldsSerializer):
     """ LikedCommentEvent model serializer. """
 
     class Meta:
@@ -815,10 +1162,10 @@ class LikedCommentEventSerializer(serializers.ModelSerializer):
     def get_post(self, obj):
         """ Returns the post of the comment that was liked. """
 
-        return obj.comment.post.id
+        return obj.comment.post_id
 
 
-class LikedPostEventSerializer(serializers.ModelSerializer):
+class LikedPostEventSerializer(CachedFieldsSerializer):
     """ LikedPostEvent model serializer. """
 
     class Meta:
@@ -834,7 +1181,7 @@ class LikedPostEventSerializer(serializers.ModelSerializer):
         return ProfileSerializer(obj.liked_by).data
 
 
-class RepostEventSerializer(serializers.ModelSerializer):
+class RepostEventSerializer(CachedFieldsSerializer):
     """ RepostEvent model serializer. """
 
     class Meta:
@@ -850,7 +1197,7 @@ class RepostEventSerializer(serializers.ModelSerializer):
         return ProfileSerializer(obj.reposted_by).data
 
 
-class NotificationSerializer(serializers.ModelSerializer):
+class NotificationSerializer(CachedFieldsSerializer):
     """ Notification model serializer. """
 
     class Meta:
@@ -860,6 +1207,42 @@ class NotificationSerializer(serializers.ModelSerializer):
 
     events = serializers.SerializerMethodField("get_events")
 
+    # event relation -> field of the event holding the user that caused it
+    event_actors = {
+        "mentioned_in_post_event": "mentioned_by",
+        "mentioned_in_comment_event": "mentioned_by",
+        "comment_on_post_event": "commentor",
+        "followed_event": "followed_by",
+        "repost_event": "reposted_by",
+        "liked_post_event": "liked_by",
+        "liked_comment_event": "liked_by",
+    }
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Returns the given Notification queryset with all of the events
+        joined, and the profiles of the users that caused the events
+        prefetched (eager loaded like any listed profile), so listing
+        notifications takes a constant number of queries.
+        """
+        # join the events, and the comments whose post is serialized
+        queryset = queryset.select_related(
+            *cls.event_actors,
+            "mentioned_in_comment_event__comment",
+            "liked_comment_event__comment"
+        )
+
+        # prefetch the profiles of the users that caused the events
+        profiles = ProfileSerializer.setup_eager_loading(
+            Profile.objects.all()
+        )
+        queryset = queryset.prefetch_related(*[
+            Prefetch(f"{event}__{actor}", queryset=profiles)
+            for event, actor in cls.event_actors.items()
+        ])
+
+        return queryset
 
     def get_events(self, obj):
         """ Returns the events associated with the notification. """
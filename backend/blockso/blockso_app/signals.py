@@ -0,0 +1,37 @@
+"""
+Module containing the signal receivers of the blockso_app application.
+Connected when the application is ready, see apps.py.
+"""
+# std lib imports
+
+# third party imports
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+# our imports
+from .models import Feed, Follow, Profile, Socials
+from . import cache
+
+
+UserModel = get_user_model()
+
+
+@receiver(post_save, sender=UserModel)
+@receiver(post_delete, sender=UserModel)
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+@receiver(post_save, sender=Socials)
+@receiver(post_delete, sender=Socials)
+@receiver(post_save, sender=Follow)
+@receiver(post_delete, sender=Follow)
+@receiver(post_delete, sender=Feed)
+@receiver(m2m_changed, sender=Feed.following.through)
+@receiver(m2m_changed, sender=Feed.followers.through)
+def invalidate_profile_lists(sender, **kwargs):
+    """
+    Invalidates the cached profile lists whenever a user, profile,
+    socials, follow, or feed membership is written, or a feed is
+    deleted, since its cascaded memberships do not send m2m_changed.
+    """
+    cache.invalidate(cache.PROFILE_LIST_PREFIX)
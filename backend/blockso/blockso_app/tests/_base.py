@@ -0,0 +1,632 @@
+"""
+Helpers and the base class shared by all of the app's tests.
+"""
+# std lib imports
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+import functools
+import json
+import secrets
+
+# third party imports
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.test.client import MULTIPART_CONTENT, encode_multipart, BOUNDARY
+from rest_framework.test import APITestCase
+from siwe_auth.models import Nonce
+from siwe.siwe import SiweMessage
+import eth_account
+import fakeredis
+import redis
+import responses
+
+# our imports
+from ..jobs import covalent_jobs
+from ..models import ERC20Transfer, ERC721Transfer, Notification, Post, \
+        Profile, Socials, Transaction
+
+
+UserModel = get_user_model()
+
+# next_update_at of the covalent samples, 5 min after the tests start
+# covalent uses nanosecond precision, so pad the microseconds with zeros
+COVALENT_NEXT_UPDATE = (datetime.now(timezone.utc) + timedelta(minutes=5))\
+    .isoformat(timespec="microseconds").replace("+00:00", "000Z")
+
+# fixed nonce and issued at time that login messages are pre-signed with
+LOGIN_NONCE = "blocksoTestNonce"
+LOGIN_ISSUED_AT = "2022-01-01T00:00:00Z"
+
+# fields of siwe messages that are the same for every login
+SIWE_MESSAGE_TEMPLATE = {
+    "domain": "127.0.0.1",
+    "version": "1",
+    "chain_id": "1",
+    "uri": "http://127.0.0.1/api/auth/login"
+}
+
+# cache used by the tests instead of the shared redis cache, each test
+# process gets its own and every test starts with it cleared
+TEST_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# the tests only ever ask for the history of a few addresses and pages
+get_tx_history_url = functools.lru_cache(maxsize=32)(
+    covalent_jobs.get_tx_history_url
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_test_signer(index):
+    """
+    Returns the test wallet (signer) with the given index.
+    Each signer is created once per process, since generating
+    keys is slow.
+    """
+    return eth_account.Account.create()
+
+
+@functools.lru_cache(maxsize=None)
+def load_covalent_sample(filename, sample_address, address):
+    """
+    Returns the parsed contents of the given covalent tx history
+    sample, with all occurrences of the sample's address replaced by
+    the given address, and the next_update_at field replaced by
+    COVALENT_NEXT_UPDATE. Each sample is read, patched and parsed once
+    per address per process, so the returned dict must not be mutated.
+    """
+    with open(
+        f"./blockso_app/samples/{filename}",
+        "r",
+        encoding="utf-8"
+    ) as fobj:
+        content = fobj.read()
+
+    content = content.replace(sample_address, address.lower())
+    content = content.replace(
+        "REPLACEME_NEXT_UPDATE_AT",
+        COVALENT_NEXT_UPDATE
+    )
+
+    return json.loads(content)
+
+
+def get_siwe_message_data(signer, nonce, issued_at):
+    """ Returns common data used for siwe (sign in with ethereum). """
+
+    return {
+        **SIWE_MESSAGE_TEMPLATE,
+        "address": signer.address,
+        "nonce": nonce,
+        "issued_at": issued_at
+    }
+
+
+def sign_login_message(signer, message_data):
+    """
+    Signs the siwe message made from the given message data.
+    Returns the data of a login request.
+    """
+    # sign message
+    message = SiweMessage(message_data).sign_message()
+    signed_msg = signer.sign_message(
+        eth_account.messages.encode_defunct(text=message)
+    )
+
+    # prepare login request data
+    message_data["issuedAt"] = message_data["issued_at"]
+    message_data["chainId"] = message_data["chain_id"]
+    return {
+        "message": message_data,
+        "signature": signed_msg.signature.hex()
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def get_login_data(signer):
+    """
+    Returns the data of a login request for the given signer, signed
+    with LOGIN_NONCE and LOGIN_ISSUED_AT. The message is signed once
+    per process instead of on every login.
+    The returned data is shared, so it must not be modified.
+    """
+    message_data = get_siwe_message_data(
+        signer,
+        LOGIN_NONCE,
+        LOGIN_ISSUED_AT
+    )
+    return sign_login_message(signer, message_data)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class BaseTest(APITestCase):
+    """ Base class for all tests. """
+
+    # verbose enough test output without printing whole responses
+    maxDiff = 2000
+
+    # whether tests start logged in as test_signer, see setUpTestData
+    prelogin = False
+
+    # whether tests also get client_2, logged in as test_signer_2
+    prelogin_2 = False
+
+    # common data for updating profile, copy it before changing it
+    update_profile_data = {
+        "image": "https://ipfs.io/ipfs/QmRRPWG96cmgTn2qSzjwr2qvfNEuhunv6FNeMFGa9bx6mQ",
+        "bio": "Hello world, I am a user.",
+        "socials": {
+            "website": "https://mysite.com/",
+            "telegram": "https://t.me/nullbitx8",
+            "discord": "https://discord.gg/nullbitx8",
+            "twitter": "https://twitter.com/nullbitx8",
+            "opensea": "https://opensea.com/nullbitx8.eth",
+            "looksrare": "https://looksrare.org/nullbitx8.eth",
+            "snapshot": "https://snapshot.org/nullbitx8.eth"
+        }
+    }
+
+    # common data for creating posts, copy it before changing it
+    create_post_data = {
+        "text": "",
+        "tagged_users": [],
+        "imgUrl": "",
+        "isShare": False,
+        "isQuote": False,
+        "refPost": None,
+        "refTx": None
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        """ Runs once before all tests. """
+
+        # get the test wallets (signers)
+        # before setting up the class, since setUpTestData uses them
+        cls.test_signer = get_test_signer(0)
+        cls.test_signer_2 = get_test_signer(1)
+
+        # mock redis backend shared by the tests of the class,
+        # it is flushed after each test
+        cls.redis_backend = fakeredis.FakeRedis()
+        redis_patcher = mock.patch.object(
+            redis,
+            "from_url",
+            return_value=cls.redis_backend
+        )
+        redis_patcher.start()
+        cls.addClassCleanup(redis_patcher.stop)
+
+        super(BaseTest, cls).setUpClass()
+
+        # sample tx history json for erc20 and erc721 transactions
+        cls.erc20_tx_resp_parsed = load_covalent_sample(
+            "covalent-tx-history-sample.json",
+            "0xa79e63e78eec28741e711f89a672a4c40876ebf3",
+            cls.test_signer.address
+        )
+        cls.erc721_tx_resp_parsed = load_covalent_sample(
+            "covalent-tx-history-erc721.json",
+            "0xc9eb983357b88921a89844d7047589a37b563108",
+            cls.test_signer.address
+        )
+
+        # erc20 sample variant that says there are more pages of results
+        # copies the sample instead of mutating it, since it is shared
+        sample = cls.erc20_tx_resp_parsed
+        cls.erc20_tx_resp_parsed_has_more = {
+            **sample,
+            "data": {
+                **sample["data"],
+                "pagination": {
+                    **sample["data"]["pagination"],
+                    "has_more": True
+                }
+            }
+        }
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Runs once before all tests, inside the transaction of the class.
+        Logs in test_signer (and test_signer_2) once if the class asks
+        for it, and keeps the session cookies so that every test can
+        reuse the sessions.
+        """
+        super().setUpTestData()
+
+        if cls.prelogin:
+            client = cls.client_class()
+            cls._force_login_client(client, cls.test_signer)
+            cls._prelogin_session_cookie = \
+                client.cookies[settings.SESSION_COOKIE_NAME].value
+
+        if cls.prelogin_2:
+            client = cls.client_class()
+            cls._force_login_client(client, cls.test_signer_2)
+            cls._prelogin_session_cookie_2 = \
+                client.cookies[settings.SESSION_COOKIE_NAME].value
+
+    def setUp(self):
+        """ Runs before each test. """
+
+        super().setUp()
+
+        # start logged in as test_signer, see setUpTestData
+        if self.prelogin:
+            self.client.cookies[settings.SESSION_COOKIE_NAME] = \
+                self._prelogin_session_cookie
+
+        # second client, logged in as test_signer_2 for the whole test
+        if self.prelogin_2:
+            self.client_2 = self.client_class()
+            self.client_2.cookies[settings.SESSION_COOKIE_NAME] = \
+                self._prelogin_session_cookie_2
+
+        # start each test with an empty cache
+        cache.clear()
+
+    def tearDown(self):
+        """ Runs after each test. """
+
+        super().tearDown()
+
+        # clean up fake redis backend
+        self.redis_backend.flushall()
+
+    @functools.cached_property
+    def mock_responses(self):
+        """
+        Fake requests/responses, started the first time a test uses
+        them so that tests without http requests skip the patching.
+        """
+        mock_responses = responses.RequestsMock()
+        mock_responses.start()
+
+        # clean up fake requests/responses
+        self.addCleanup(mock_responses.reset)
+        self.addCleanup(mock_responses.stop)
+
+        return mock_responses
+
+    def _patch_tx_history(self, address, *pages):
+        """
+        Patches the covalent http client so that requesting the n-th
+        page of the address' tx history returns the n-th of the given
+        (already parsed) pages, without going through any http layer.
+        """
+        pages_by_url = {
+            get_tx_history_url(address, page_number): page
+            for page_number, page in enumerate(pages)
+        }
+
+        def get(url):
+            """ Returns a fake response holding the page for the url. """
+
+            return mock.Mock(**{"json.return_value": pages_by_url[url]})
+
+        patcher = mock.patch.object(covalent_jobs.client, "get", get)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @classmethod
+    def _login_client(cls, client, signer):
+        """
+        Utility function to do a login with a pre-signed message
+        using the given client.
+        Stores the nonce that the message was signed with, like the
+        nonce endpoint would, then makes the login request.
+        Returns the response of the login request.
+        Note: the authentication backend creates a user if one
+        does not already exist for the wallet doing the authentication.
+        """
+        # store the nonce of the pre-signed message
+        expiration = datetime.now(timezone.utc) + \
+            timedelta(seconds=settings.AUTH_NONCE_AGE)
+        Nonce.objects.update_or_create(
+            value=LOGIN_NONCE,
+            defaults={"expiration": expiration}
+        )
+
+        # make login request
+        url = "/api/auth/login/"
+        resp = client.post(url, get_login_data(signer))
+
+        # return response
+        return resp
+
+    def _do_login(self, signer):
+        """
+        Utility function to log in the test client as the given signer.
+        Returns the response of the login request.
+        """
+        return self._login_client(self.client, signer)
+
+    @classmethod
+    def _force_login_client(cls, client, signer):
+        """
+        Utility function to log in the given client as the given signer
+        without going through sign in with ethereum.
+        Creates the user, profile and socials like a login would.
+        """
+        user, _ = UserModel.objects.get_or_create(
+            ethereum_address=signer.address
+        )
+        profile, _ = Profile.objects.get_or_create(user=user)
+        Socials.objects.get_or_create(profile=profile)
+        client.force_login(user)
+
+    def _force_login(self, signer):
+        """
+        Utility function to log in the test client as the given signer,
+        for tests that only need a logged in user. Tests of the login
+        itself should use _do_login or _do_siwe_login instead.
+        """
+        self._force_login_client(self.client, signer)
+
+    def _do_siwe_login(self, signer):
+        """
+        Utility function to get a nonce, sign a message, and do a login.
+        Goes through the whole sign in with ethereum flow, unlike
+        _do_login, so it is meant for tests of the login itself.
+        Returns the response of the login request.
+        """
+        # get nonce from backend
+        resp = self.client.get("/api/auth/nonce/")
+        nonce = resp.data["nonce"]
+
+        # prepare and sign message
+        issued_at = datetime.now(timezone.utc).replace(microsecond=0)
+        message_data = get_siwe_message_data(
+            signer,
+            nonce,
+            issued_at.isoformat().replace("+00:00", "Z")
+        )
+        data = sign_login_message(signer, message_data)
+
+        # make login request
+        url = "/api/auth/login/"
+        resp = self.client.post(url, data)
+
+        # return response
+        return resp
+
+    def _do_logout(self):
+        """
+        Utility function to log out a user.
+        Returns the response of the logout request.
+        """
+        url = "/api/auth/logout/"
+        return self.client.post(url)
+
+    def _create_users(self, amount):
+        """
+        Utility function to create amount number of users that have
+        logged in before, without going through the login itself.
+        Returns a list of signers that contain the wallets
+        of all the created users.
+        """
+        self._bulk_create_profiles(
+            amount,
+            last_login=datetime.now(timezone.utc)
+        )
+
+        # same signers that _bulk_create_profiles created the users for
+        return [get_test_signer(2 + i) for i in range(amount)]
+
+    def _bulk_create_profiles(self, amount, last_login=None):
+        """
+        Utility function to create amount number of users with
+        profiles directly in the database, without logging them in.
+        The users' last login is set to the given last_login.
+        Returns a list of the created Profiles.
+        """
+        # reuse the pool of test signers, after the two main ones
+        users = UserModel.objects.bulk_create([
+            UserModel(
+                ethereum_address=get_test_signer(2 + i).address,
+                last_login=last_login
+            )
+            for i in range(amount)
+        ])
+        profiles = Profile.objects.bulk_create([
+            Profile(user=user) for user in users
+        ])
+        Socials.objects.bulk_create([
+            Socials(profile=profile) for profile in profiles
+        ])
+
+        return profiles
+
+    def _bulk_create_notifications(self, signer, amount):
+        """
+        Utility function to create amount number of notifications for
+        the given signer directly in the database, without the events
+        that would cause them.
+        Returns a list of the created notifications' ids.
+        """
+        profile = Profile.objects.get(user_id=signer.address)
+        notifs = Notification.objects.bulk_create([
+            Notification(user=profile) for _ in range(amount)
+        ])
+
+        return [notif.id for notif in notifs]
+
+    def _bulk_create_tx_post(self, author, num_transfers, ref_post=None):
+        """
+        Utility function to create a post by the given author Profile
+        directly in the database, referring to a transaction with
+        num_transfers ERC20 and num_transfers ERC721 transfers.
+        The post quotes ref_post if one is given.
+        Returns the created Post.
+        """
+        tx = Transaction.objects.create(
+            chain_id=1,
+            tx_hash=f"0x{secrets.token_hex(32)}",
+            block_signed_at=datetime.now(timezone.utc),
+            from_address=author.user_id,
+            to_address=author.user_id,
+            value="0"
+        )
+        transfer_data = {
+            "tx": tx,
+            "contract_name": "Test",
+            "contract_ticker": "TEST",
+            "logo_url": "https://example.com/logo.png",
+            "from_address": author.user_id,
+            "to_address": author.user_id
+        }
+        ERC20Transfer.objects.bulk_create([
+            ERC20Transfer(
+                contract_address=f"0x{i}",
+                amount="1",
+                decimals=18,
+                **transfer_data
+            )
+            for i in range(num_transfers)
+        ])
+        ERC721Transfer.objects.bulk_create([
+            ERC721Transfer(
+                contract_address=f"0x{i}",
+                token_id=str(i),
+                **transfer_data
+            )
+            for i in range(num_transfers)
+        ])
+
+        return Post.objects.create(
+            author=author,
+            refTx=tx,
+            refPost=ref_post,
+            isShare=False,
+            isQuote=ref_post is not None
+        )
+
+    def _update_profile(self, signer):
+        """
+        Utility function to create a Profile using
+        the given test data.
+        This function will usually be called after authenticating
+        with the _force_login function above.
+        """
+        # update profile
+        url = f"/api/{signer.address}/profile/"
+        resp = self.client.put(url, self.update_profile_data)
+        return resp
+
+    def _create_post(self, tagged_users=[], client=None):
+        """
+        Utility function to create a post,
+        using the test client unless another client is given.
+        Returns the response of creating a post.
+        """
+        # prepare request
+        url = f"/api/post/"
+        data = {
+            **self.create_post_data,
+            "text": "My first post!",
+            "imgUrl": "https://fakeimage.com/img.png",
+            "tagged_users": tagged_users
+        }
+
+        # send request
+        resp = (client or self.client).post(url, data)
+
+        return resp
+
+    def _repost(self, post_id, client=None):
+        """
+        Utility function to repost a post,
+        using the test client unless another client is given.
+        Returns the response of creating the repost.
+        """
+        # prepare request
+        url = f"/api/post/"
+        data = {
+            **self.create_post_data,
+            "isShare": True,
+            "refPost": post_id
+        }
+
+        # send request
+        resp = (client or self.client).post(url, data)
+
+        return resp
+
+    def _create_comment(self, post_id, text, tagged_users=[], client=None):
+        """
+        Utility function to create a comment on a post,
+        using the test client unless another client is given.
+        Returns the response of creating a comment.
+        """
+        url = f"/api/posts/{post_id}/comments/"
+        data = {"text": text, "tagged_users": tagged_users}
+        resp = (client or self.client).post(url, data)
+        return resp
+
+    def _follow_user(self, address, client=None):
+        """
+        Utility function to follow the user with the given address,
+        using the test client unless another client is given.
+        Returns the response of following the user.
+        """
+        url = f"/api/{address}/follow/"
+        resp = (client or self.client).post(url)
+        return resp
+
+    def _create_feed(self, name="", description="", editable=False):
+        """
+        Utility function to create a Feed.
+        Returns the response of creating the feed.
+        """
+        url = "/api/feeds/"
+        data = {
+            "name": name,
+            "description": description,
+            "followingEditableByPublic": editable
+        }
+        resp = self.client.post(url, data)
+
+        return resp
+
+    def _create_feed_image(self, feed_id):
+        """
+        Utility function to create a Feed.
+        Returns the response of creating the feed.
+        """
+        url = f"/api/feeds/{feed_id}/image/"
+        fake_img = SimpleUploadedFile("test.jpg", b"", content_type="image/jpeg")
+        data = encode_multipart(data={"image": fake_img}, boundary=BOUNDARY)
+        resp = self.client.put(
+            url,
+            data,
+            content_type=MULTIPART_CONTENT
+        )
+
+        return resp
+
+    def _follow_feed(self, feed_id):
+        """
+        Utility function to follow the given feed.
+        Returns the response of following the user.
+        """
+        url = f"/api/feeds/{feed_id}/follow/"
+        resp = self.client.post(url)
+
+        return resp
+
+    def _add_feed_following(self, feed_id, address):
+        """
+        Utility function to follow the given address by the given feed.
+        Returns the response of following the user by the feed.
+        """
+        url = f"/api/feeds/{feed_id}/following/{address}/"
+        resp = self.client.post(url)
+
+        return resp
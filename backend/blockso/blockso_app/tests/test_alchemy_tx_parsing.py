@@ -0,0 +1,278 @@
+# std lib imports
+from unittest import mock
+
+# third party imports
+from web3.contract import ContractFunction
+from web3.datastructures import AttributeDict
+from web3.eth import Eth
+
+# our imports
+from ._base import BaseTest
+from ..jobs import alchemy_jobs
+from ..models import Post, Transaction, ERC20Transfer, ERC721Transfer
+from ..samples import alchemy_notify_samples
+from ..web3_client import w3
+
+
+class AlchemyNotifyTxParsingTests(BaseTest):
+    """
+    Tests behavior related to getting transaction history
+    from Alchemy Notify and using it to create Posts.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """ Runs once before all tests. """
+
+        super().setUpClass()
+
+        # mock get_block return data -- only mocking values we need
+        mock_block_data = AttributeDict({
+            'timestamp': 1673395967
+        })
+
+        # mock get_transaction return data -- only mocking values we need
+        mock_tx_data = AttributeDict({
+            'from': '0xA1E4380A3B1f749673E270229993eE55F35663b4',
+            'to': '0x5DF9B87991262F6BA471F09758CDE1c0FC1De734',
+            'value': 31337,
+        })
+
+        # mock web3 calls once for the whole class
+        patchers = [
+            mock.patch.object(Eth, "get_block", return_value=mock_block_data),
+            mock.patch.object(
+                Eth,
+                "get_transaction_by_block",
+                return_value=mock_tx_data
+            ),
+            mock.patch.object(
+                Eth,
+                "get_transaction",
+                return_value=mock_tx_data
+            ),
+            # mock contract call function
+            mock.patch.object(
+                ContractFunction,
+                "call",
+                return_value="Fake Val"
+            )
+        ]
+        for patcher in patchers:
+            patcher.start()
+            cls.addClassCleanup(patcher.stop)
+
+    @mock.patch("web3.eth.Eth.get_transaction")
+    def test_process_external_eth_transfer(self, mock_get_tx):
+        """
+        Assert that an external eth transfer
+        from or to an address is handled correctly.
+        Assert that a Transaction is created.
+        Assert that a Post is created for the
+        sender and recipient.
+        """
+        # set up test
+        eth_transfer = alchemy_notify_samples.eth_transfer
+        activity = eth_transfer["event"]["activity"][0]
+        mock_get_tx.return_value = AttributeDict({
+            "from": activity["fromAddress"],
+            "to": activity["toAddress"],
+            'value': 31337
+        })
+
+        # call function
+        alchemy_jobs.process_webhook_data(eth_transfer)
+
+        # make assertions
+        # assert that a Transaction was created
+        tx = Transaction.objects.get(tx_hash=activity["hash"])
+
+        # assert that a Post was created for both the from and to addresses
+        from_address = w3.toChecksumAddress(activity["fromAddress"])
+        from_post = Post.objects.get(author__user_id=from_address)
+        self.assertEqual(from_post.refTx, tx)
+
+        to_address = w3.toChecksumAddress(activity["toAddress"])
+        to_post = Post.objects.get(author__user_id=to_address)
+        self.assertEqual(to_post.refTx, tx)
+
+    @mock.patch("web3.eth.Eth.get_transaction")
+    def test_process_multiple_external_eth_transfer(self, mock_get_tx):
+        """
+        Assert that multiple external eth transfers
+        are handled correctly.
+        Assert that a Transaction is created.
+        Assert that a Post is created for the
+        sender and recipient.
+        """
+        # set up test
+        eth_transfers = alchemy_notify_samples.multiple_eth_transfers
+        side_effects = []
+        for item in eth_transfers["event"]["activity"]:
+            side_effects.append(
+                AttributeDict({
+                    "from": item["fromAddress"],
+                    "to": item["toAddress"],
+                    'value': 31337
+                })
+            )
+        mock_get_tx.side_effect = side_effects
+
+        # call function
+        alchemy_jobs.process_webhook_data(eth_transfers)
+
+        # make assertions
+        for item in eth_transfers["event"]["activity"]:
+            # assert that a Transaction was created
+            tx = Transaction.objects.get(tx_hash=item["hash"])
+
+            # assert that a Post was created for both the from and to addresses
+            from_address = w3.toChecksumAddress(item["fromAddress"])
+            self.assertEqual(1,
+                Post.objects.filter(
+                    author__user_id=from_address, refTx=tx
+                ).count()
+            )
+
+            to_address = w3.toChecksumAddress(item["toAddress"])
+            self.assertEqual(1,
+                Post.objects.filter(
+                    author__user_id=to_address, refTx=tx
+                ).count()
+            )
+
+    def test_process_erc20_transfer(self):
+        """
+        Assert that an erc20 transfer is parsed correctly.
+        Assert that a Transaction is created for the tx that
+        the erc20 transfer relates to.
+        Assert that the from and to addresses now have Posts that
+        reflect their transaction history.
+        """
+        # set up test
+        erc20_transfer = alchemy_notify_samples.erc20_transfer
+
+        # call function
+        alchemy_jobs.process_webhook_data(erc20_transfer)
+
+        # make assertions
+        # assert that a Transaction was created
+        activity = erc20_transfer["event"]["activity"][0]
+        tx = Transaction.objects.get(tx_hash=activity["hash"])
+
+        # assert that an ERC20Transfer was created
+        transfer = ERC20Transfer.objects.get(tx=tx)
+        self.assertEqual(
+            transfer.from_address,
+            w3.toChecksumAddress(activity["fromAddress"])
+        )
+        self.assertEqual(
+            transfer.to_address,
+            w3.toChecksumAddress(activity["toAddress"])
+        )
+        self.assertEqual(
+            transfer.contract_address,
+            w3.toChecksumAddress(activity["rawContract"]["address"])
+        )
+        self.assertEqual(
+            transfer.amount,
+            str(w3.toInt(hexstr=activity["log"]["data"]))
+        )
+
+        # assert that a Post was created for both the from and to addresses
+        from_address = w3.toChecksumAddress(activity["fromAddress"])
+        from_post = Post.objects.get(author__user_id=from_address)
+        self.assertEqual(from_post.refTx, tx)
+
+        to_address = w3.toChecksumAddress(activity["toAddress"])
+        to_post = Post.objects.get(author__user_id=to_address)
+        self.assertEqual(to_post.refTx, tx)
+
+    def test_process_erc721_transfer(self):
+        """
+        Assert that an erc721 transfer is parsed correctly.
+        Assert that a Transaction is created for the tx that
+        the erc721 transfer relates to.
+        Assert that the from and to addresses now have Posts that
+        reflect their transaction history.
+        """
+        # set up test
+        erc721_transfer = alchemy_notify_samples.erc721_transfer
+
+        # call function
+        alchemy_jobs.process_webhook_data(erc721_transfer)
+
+        # make assertions
+        # assert that a Transaction was created
+        activity = erc721_transfer["event"]["activity"][0]
+        tx = Transaction.objects.get(tx_hash=activity["hash"])
+
+        # assert that an ERC721Transfer was created
+        transfer = ERC721Transfer.objects.get(tx=tx)
+        self.assertEqual(
+            transfer.from_address,
+            w3.toChecksumAddress(activity["fromAddress"])
+        )
+        self.assertEqual(
+            transfer.to_address,
+            w3.toChecksumAddress(activity["toAddress"])
+        )
+        self.assertEqual(
+            transfer.contract_address,
+            w3.toChecksumAddress(activity["rawContract"]["address"])
+        )
+        self.assertEqual(
+            transfer.token_id,
+            str(w3.toInt(hexstr=activity["erc721TokenId"]))
+        )
+
+        # assert that a Post was not created for the from address since
+        # the from is the zero address
+        from_address = w3.toChecksumAddress(activity["fromAddress"])
+        from_post = Post.objects.filter(author__user_id=from_address)
+        self.assertEqual(from_post.exists(), False)
+
+        # assert that a Post was created for the to address
+        to_address = w3.toChecksumAddress(activity["toAddress"])
+        to_post = Post.objects.get(author__user_id=to_address)
+        self.assertEqual(to_post.refTx, tx)
+
+    def test_reorged_transaction(self):
+        """
+        Assert that a reorged transaction is 
+        removed from the database, along with
+        any related Posts.
+        """
+        # set up test
+        erc721_transfer = alchemy_notify_samples.erc721_transfer
+        activity = erc721_transfer["event"]["activity"][0]
+
+        # process a webhook request where removed = False
+        # therefore it should create objects in the database
+        alchemy_jobs.process_webhook_data(erc721_transfer)
+
+        # assert that a Transaction, ERC721Transfer, and Post were created
+        tx = Transaction.objects.get(tx_hash=activity["hash"])
+        self.assertTrue(ERC721Transfer.objects.filter(tx=tx).exists())
+        self.assertTrue(
+            Post.objects.filter(
+                author__user_id=w3.toChecksumAddress(activity["toAddress"])
+            ).exists()
+        )
+
+        # process a follow up webhook request where removed = True 
+        # therefore it should remove all objects related to the
+        # transaction that was reorged
+        reorged_transfer = alchemy_notify_samples.reorged_erc721_transfer
+        alchemy_jobs.process_webhook_data(reorged_transfer)
+
+        # assert that the Transaction, ERC721Transfer, and Post were deleted
+        self.assertFalse(
+            Transaction.objects.filter(tx_hash=activity["hash"]).exists()
+        )
+        self.assertFalse(ERC721Transfer.objects.filter(tx=tx).exists())
+        self.assertFalse(
+            Post.objects.filter(
+                author__user_id=w3.toChecksumAddress(activity["toAddress"])
+            ).exists()
+        )
@@ -0,0 +1,40 @@
+# std lib imports
+import json
+
+# third party imports
+import rq
+
+# our imports
+from ._base import BaseTest
+from ..views import get_expected_alchemy_sig
+
+
+class AlchemyWebhookTests(BaseTest):
+    """
+    Tests behavior around the webhook for Alchemy Notify.
+    """
+
+    def test_notify_wh_adds_job_on_rq(self):
+        """
+        Assert that a successfully authenticated webhook
+        request is added to a redis queue for
+        processing by one of the workers.
+        """
+        # set up test
+        url = "/api/alchemy-notify-webhook/"
+        data={"fakekey":"fakeval"}
+        body = json.dumps(data).replace(" ", "")
+        valid_sig = get_expected_alchemy_sig(body)
+        extra_headers = {"HTTP_X-Alchemy-Signature": valid_sig}
+
+        # make request
+        resp = self.client.post(
+            url,
+            data=data,
+            **extra_headers
+        )
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        queue = rq.Queue(connection=self.redis_backend, name="tx_processing")
+        self.assertEqual(len(queue), 1)
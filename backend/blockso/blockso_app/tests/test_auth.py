@@ -0,0 +1,91 @@
+# std lib imports
+
+# third party imports
+from siwe_auth.models import Nonce
+
+# our imports
+from ._base import BaseTest
+
+
+class AuthTests(BaseTest):
+    """
+    Tests authentication using ETH wallet.
+    Auth is based on https://eips.ethereum.org/EIPS/eip-4361
+    and https://github.com/payton/django-siwe-auth/blob/main/siwe_auth/views.py
+    """
+
+    def test_nonce(self):
+        """
+        Assert that a nonce is returned to the user.
+        """
+        # set up test
+        url = "/api/auth/nonce/"
+
+        # make request
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        nonce = Nonce.objects.all()[0]
+        self.assertEqual(resp.data["nonce"], nonce.value) 
+
+    def test_login(self):
+        """
+        Assert that a user can create a session by signing a message.
+        """
+        # do login
+        resp = self._do_siwe_login(self.test_signer)
+
+        # make assertions
+        # assert that the user has a session
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(
+            self.client.session["_auth_user_id"],
+            self.test_signer.address
+        )
+
+    def test_logout(self):
+        """
+        Assert that a user can terminate their session by logging out.
+        """
+        # prepare test
+        self._do_login(self.test_signer)
+
+        # logout
+        resp = self.client.post("/api/auth/logout/")
+
+        # make assertions
+        # assert that the user no longer has a session
+        self.assertEqual(resp.status_code, 200)
+        session_key = self.client.cookies.get("sessionid").value
+        self.assertEqual(session_key, "")
+
+    def test_logout_unauthed(self):
+        """
+        Assert that a user can call logout even if they are not authenticated.
+        """
+        # prepare test
+        # logout
+        resp = self.client.post("/api/auth/logout/")
+
+        # make assertions
+        # assert that the user no longer has a session
+        self.assertEqual(resp.status_code, 200)
+
+    def test_auth_get_session(self):
+        """
+        Assert that an authenticated user gets
+        their authenticated ethereum address and chain id
+        when they make a GET to /auth/session/.
+        """
+        # do login
+        self._do_login(self.test_signer)
+
+        # make request to session endpoint
+        url = f"/api/auth/session/"
+        resp = self.client.get(url)
+
+        # assert correct data
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["address"], self.test_signer.address)
+        self.assertEqual(resp.data["chainId"], 1)
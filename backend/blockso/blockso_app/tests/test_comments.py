@@ -0,0 +1,322 @@
+# std lib imports
+
+# third party imports
+
+# our imports
+from ._base import BaseTest
+from ..models import Comment, Post, Profile, Notification, \
+    MentionedInCommentEvent
+
+
+class CommentsTests(BaseTest):
+    """
+    Test behavior around comments.
+    """
+
+    prelogin = True
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Runs once before all tests, inside the transaction of the class.
+        Creates a post by the logged in test_signer to comment on.
+        """
+        super().setUpTestData()
+
+        author = Profile.objects.get(user_id=cls.test_signer.address)
+        cls.post = Post.objects.create(
+            author=author,
+            text="My first post!",
+            imgUrl="https://fakeimage.com/img.png",
+            isShare=False,
+            isQuote=False
+        )
+
+    def test_create_comment(self):
+        """
+        Assert that a comment is created successfully by a logged in user.
+        """
+        # set up test
+        post_id = self.post.id
+
+        # make request
+        text = "I <3 your post!"
+        resp = self._create_comment(post_id, text=text)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(resp.data["id"], 1)
+        self.assertEqual(resp.data["post"], 1)
+        self.assertEqual(resp.data["text"], text)
+        self.assertEqual(
+            resp.data["author"]["address"],
+            self.test_signer.address
+        )
+
+    def test_create_comment_empty(self):
+        """
+        Assert that creating an empty comment
+        returns a 400 BAD REQUEST.
+        """
+        # set up test
+        post_id = self.post.id
+
+        # make request
+        resp = self._create_comment(post_id, text="")
+
+        # make assertions
+        self.assertEqual(resp.status_code, 400)
+
+    def test_tag_users_in_comment(self):
+        """
+        Assert that a user can tag other users in a comment.
+        """
+        # set up test
+        post_id = self.post.id
+
+        # make request
+        text = f"I <3 @{self.test_signer.address}'s post!"
+        tagged = [self.test_signer.address]
+        resp = self._create_comment(
+            post_id,
+            text=text,
+            tagged_users=tagged
+        )
+
+        # make assertions
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(resp.data["text"], text)
+        self.assertEqual(
+            MentionedInCommentEvent.objects.filter(
+                notification__user__user_id=self.test_signer.address
+            ).count(),
+            1
+        )
+
+    def test_tag_everyone_in_comment(self):
+        """
+        Assert that a user can tag everyone in a comment.
+        """
+        # set up test
+        # create 5 users and a post
+        signers = self._create_users(5)
+        addresses = [signer.address for signer in signers]
+        self._force_login(signers[0])
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # make request to mention everyone in a comment
+        tagged = ["everyone", addresses[1]]
+        resp = self._create_comment(
+            post_id,
+            "hello frens",
+            tagged_users=tagged
+        )
+
+        # make assertions
+        self.assertEqual(resp.status_code, 201)
+
+        # assert that all users received notifications
+        notifs = Notification.objects.filter(user__user_id__in=addresses[1:])
+        self.assertEqual(notifs.count(), 4)
+        self.assertEqual(
+            MentionedInCommentEvent.objects.filter(
+                notification__in=notifs
+            ).count(),
+            4
+        )
+
+        # assert that the post author did not receive a notification
+        self.assertEqual(
+            MentionedInCommentEvent.objects.filter(
+                notification__user__user_id=addresses[0]
+            ).count(),
+            0
+        )
+
+    def test_list_comments(self):
+        """
+        Assert that a user can view comments on a post.
+        """
+        # set up test
+        post_id = self.post.id
+        self._create_comment(post_id, text="hello")
+
+        # make request
+        url = f"/api/posts/{post_id}/comments/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.data["results"]), 1)
+
+    def test_list_comments_ordering(self):
+        """
+        Assert that comments are ordered from newest to oldest.
+        """
+        # set up test
+        post_id = self.post.id
+        self._create_comment(post_id, text="goodbye")
+        self._create_comment(post_id, text="hello")
+
+        # make request
+        url = f"/api/posts/{post_id}/comments/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        results = resp.data["results"]
+        self.assertEqual(results[0]["text"], "hello")
+        self.assertEqual(results[1]["text"], "goodbye")
+
+    def test_list_comments_pagination(self):
+        """
+        Assert that comments are paginated by 5.
+        """
+        # set up test
+        post_id = self.post.id
+
+        # create 7 comments
+        author = Profile.objects.get(user_id=self.test_signer.address)
+        Comment.objects.bulk_create([
+            Comment(author=author, post_id=post_id, text=f"comment {i+1}")
+            for i in range(7)
+        ])
+
+        # make request
+        url = f"/api/posts/{post_id}/comments/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.data["results"]), 5)
+
+        # make request for second page
+        resp = self.client.get(resp.data["next"])
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.data["results"]), 2)
+
+    def test_list_comments_pfp(self):
+        """
+        Assert that a comment includes the pfp of its author
+        as part of its deserialized data.
+        """
+        # set up test
+        self._update_profile(self.test_signer)
+        post_id = self.post.id
+        self._create_comment(post_id, text="hello")
+
+        # make request
+        url = f"/api/posts/{post_id}/comments/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(
+            resp.data["results"][0]["author"]["image"],
+            self.update_profile_data["image"]
+        )
+
+    def test_like_unlike_comment(self):
+        """
+        Assert that a user can like/unlike another user's comment.
+        """
+        # set up test
+        # user 1 comments on their post
+        post_id = self.post.id
+        resp = self._create_comment(post_id, "hello")
+        comment_id = resp.data["id"]
+
+        # make request by user 2 to like user 1's comment
+        url = f"/api/posts/{post_id}/comments/{comment_id}/likes/"
+        self._force_login(self.test_signer_2)
+        resp = self.client.post(url)
+
+        # assert comment was liked successfully
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(
+            resp.data["liker"]["address"],
+            self.test_signer_2.address
+        )
+
+        # make request by user 2 to unlike user 1 comment
+        resp = self.client.delete(url)
+
+        # assert comment was unliked successfully
+        resp = self.client.get(url)
+        self.assertEqual(resp.data["count"], 0)
+        self.assertEqual(resp.data["results"], [])
+
+    def test_like_comment_twice(self):
+        """
+        Assert that a user cannot like a comment twice.
+        """
+        # set up test
+        # user 1 comments on their post
+        post_id = self.post.id
+        resp = self._create_comment(post_id, "hello")
+        comment_id = resp.data["id"]
+
+        # make request by user 2 to like user 1's comment twice
+        url = f"/api/posts/{post_id}/comments/{comment_id}/likes/"
+        self._force_login(self.test_signer_2)
+        resp = self.client.post(url)
+        resp = self.client.post(url)
+
+        # assert second like was unsuccessful
+        self.assertEqual(resp.status_code, 400)
+
+        # assert that total likes is 1
+        resp = self.client.get(url)
+        self.assertEqual(resp.data["count"], 1)
+        self.assertEqual(
+            resp.data["results"][0]["liker"]["address"], 
+            self.test_signer_2.address
+        )
+
+    def test_get_comment_num_likes(self):
+        """
+        Assert that the number of likes a comment has is returned
+        as part of the serialized Comment data.
+        """
+        # set up test
+        # user 1 comments on their post
+        post_id = self.post.id
+        resp = self._create_comment(post_id, "hello")
+        comment_id = resp.data["id"]
+
+        # user 2 likes user 1's comment
+        url = f"/api/posts/{post_id}/comments/{comment_id}/likes/"
+        self._force_login(self.test_signer_2)
+        self.client.post(url)
+
+        # make request to get the comment
+        url = f"/api/posts/{post_id}/comments/{comment_id}/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.data["numLikes"], 1)
+
+    def test_get_comment_liked_by_me(self):
+        """
+        Assert that likedByMe is True if the user liked the given comment.
+        Assert that likedByMe is False otherwise.
+        """
+        # set up test
+        # user 1 comments on their post
+        post_id = self.post.id
+        resp = self._create_comment(post_id, "hello")
+        comment_id = resp.data["id"]
+
+        # user 2 likes user 1's comment
+        url = f"/api/posts/{post_id}/comments/{comment_id}/likes/"
+        self._force_login(self.test_signer_2)
+        resp = self.client.post(url)
+
+        # make request to get the comment
+        url = f"/api/posts/{post_id}/comments/{comment_id}/"
+        resp = self.client.get(url)
+        
+        # make assertions
+        self.assertEqual(resp.data["likedByMe"], True)
@@ -0,0 +1,134 @@
+# std lib imports
+
+# third party imports
+
+# our imports
+from ._base import BaseTest
+from ..jobs import covalent_jobs
+from ..models import Post, Transaction, ERC20Transfer, ERC721Transfer
+
+
+class CovalentTransactionParsingTests(BaseTest):
+    """
+    Tests behavior related to getting transaction history
+    from Covalent and using it to create Posts.
+    """
+
+    def test_process_address_txs(self):
+        """
+        Assert that an address' tx history is retrieved
+        and parsed correctly.
+        Assert that the address now has Transactions that
+        reflect their transaction history.
+        """
+        # set up test
+        self._patch_tx_history(
+            self.test_signer.address,
+            self.erc20_tx_resp_parsed
+        )
+
+        # call function
+        covalent_jobs.process_address_txs(self.test_signer.address)
+
+        # make assertions
+        # assert that the correct number of Transactions has been created
+        tx_count = Transaction.objects.all().count()
+        self.assertEqual(tx_count, 6)
+
+    def test_process_erc20_transfers(self):
+        """
+        Assert that an address' tx history is retrieved
+        and parsed correctly.
+        Assert that the address now has ERC20Transfers that
+        reflect their transaction history.
+        """
+        # set up test
+        self._patch_tx_history(
+            self.test_signer.address,
+            self.erc20_tx_resp_parsed
+        )
+
+        # call function
+        covalent_jobs.process_address_txs(self.test_signer.address)
+
+        # make assertions
+        # assert that the correct number of ERC20Transfers has been created
+        transfer_count = ERC20Transfer.objects.all().count()
+        self.assertEqual(transfer_count, 4)
+
+    def test_process_erc721_transfers(self):
+        """
+        Assert that a user's history with erc721 txs
+        is parsed and stored correctly.
+        """
+        # set up test
+        self._patch_tx_history(
+            self.test_signer.address,
+            self.erc721_tx_resp_parsed
+        )
+
+        # call function
+        covalent_jobs.process_address_txs(self.test_signer.address)
+
+        # make assertions
+        # assert that the correct number of Transactions has been created
+        tx_count = Transaction.objects.all().count()
+        self.assertEqual(tx_count, 1)
+
+        # assert that the correct number of Posts has been created
+        # there should be as many Posts as Transactions/Transfers where
+        # the post author is the from address
+        self.assertEqual(Post.objects.all().count(), 1)
+
+        # assert that the correct number of ERC721Transfers has been created
+        erc721_transfer_count = ERC721Transfer.objects.all().count()
+        self.assertEqual(erc721_transfer_count, 1)
+
+    def test_posts_originate_from_address(self):
+        """
+        Assert that posts are only created for
+        transactions or transfers that originate
+        from the given address.
+        This is meant to reduce spam and provide more
+        quality posts.
+        """
+        # set up test
+        self._patch_tx_history(
+            self.test_signer.address,
+            self.erc20_tx_resp_parsed
+        )
+
+        # call function
+        covalent_jobs.process_address_txs(self.test_signer.address)
+
+        # make assertions
+        # assert that the correct number of Posts has been created
+        post_count = Post.objects.all().count()
+        self.assertEqual(post_count, 6)
+
+    def test_process_address_tx_no_limit(self):
+        """
+        Assert that the entire tx history of a user is paginated
+        through when the 'limit' argument is None and covalent
+        says there are more pages with results.
+        """
+        # set up test
+        # mock first covalent response to indicate there are more results
+        has_more_results = self.erc20_tx_resp_parsed_has_more
+
+        # mock second covalent response to indicate there are no more results
+        # note that the url being mocked has page number 1 which means
+        # we are expecting the code to paginate through the results
+        no_more_results = self.erc721_tx_resp_parsed
+        self._patch_tx_history(
+            self.test_signer.address,
+            has_more_results,
+            no_more_results
+        )
+
+        # run the job
+        covalent_jobs.process_address_txs(self.test_signer.address, limit=None)
+
+        # assert that all of the users' tx history was parsed
+        self.assertEqual(ERC721Transfer.objects.all().count(), 1)
+        self.assertEqual(ERC20Transfer.objects.all().count(), 4)
@@ -0,0 +1,120 @@
+# std lib imports
+
+# third party imports
+
+# our imports
+from ._base import BaseTest
+from ..models import Feed, Follow, Profile
+
+
+class ExploreTests(BaseTest):
+    """
+    Test behavior around explore page.
+    """
+
+    def test_explore_feed(self):
+        """
+        Assert that the explore endpoint returns a featured feed.
+        """
+        # set up test
+        # create a feed
+        self._force_login(self.test_signer)
+        resp = self._create_feed()
+        feed = Feed.objects.get(pk=resp.data["id"])
+
+        # make a request to the explore endpoint
+        self._do_logout()
+        url = "/api/explore/"
+        resp = self.client.get(url)
+
+        # assert that the created feed is in the featured feeds
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["feeds"][0]["name"], feed.name)
+        self.assertEqual(resp.data["feeds"][0]["image"], None)
+
+    def test_explore_profiles_by_follower_count(self):
+        """
+        Assert that the top 8 profiles by follower count are returned.
+        """
+        # set up test
+        profiles = self._bulk_create_profiles(10)
+
+        # make each user follow the remaining users
+        # so user 1 follows users 2-10
+        # user 2 follows users 3-10, etc
+        Follow.objects.bulk_create([
+            Follow(src=profiles[i], dest=profiles[j])
+            for i in range(10)
+            for j in range(i+1, 10)
+        ])
+
+        # make request to fetch explore page profiles
+        url = "/api/explore/"
+        resp = self.client.get(url)
+
+        # make assertions
+        # assert that the top 8 profiles are returned
+        self.assertEqual(len(resp.data["profiles"]), 8)
+
+        # assert that the explore profiles are sorted
+        # in order from most followers to least
+        # user 10 should have the most followers
+        # user 3 should have the least followers
+        for i in range(8):
+            self.assertEqual(
+                resp.data["profiles"][i]["address"],
+                profiles[9-i].user_id
+            )
+
+    def test_explore_profiles_followed_by_me(self):
+        """
+        Assert that the explore profiles show
+        whether the requestor follows them.
+        """
+        # set up test
+        # user 1 follows the first of two profiles
+        self._force_login(self.test_signer)
+        user_1 = Profile.objects.get(user_id=self.test_signer.address)
+        profiles = self._bulk_create_profiles(2)
+        Follow.objects.create(src=user_1, dest=profiles[0])
+
+        # make request to fetch explore page profiles
+        url = "/api/explore/"
+        resp = self.client.get(url)
+
+        # make assertions
+        followed_by_me = {
+            profile["address"]: profile["followedByMe"]
+            for profile in resp.data["profiles"]
+        }
+        self.assertTrue(followed_by_me[profiles[0].user_id])
+        self.assertFalse(followed_by_me[profiles[1].user_id])
+
+    def test_explore_feeds_by_follower_count(self):
+        """
+        Assert that the 4 most followed feeds are returned.
+        """
+        # create 4 feeds
+        self._force_login(self.test_signer)
+        feeds = []
+        for i in range(4):
+            resp = self._create_feed(name=i)
+            feeds.append(resp.data["id"])
+
+        # create 4 users and follow the feeds in decreasing amounts
+        # feeds[0] gets the most follows, feeds[3] gets the least
+        signers = self._create_users(4)
+        for i in range(4):
+            self._force_login(signers[i])
+            for j in range(0, 4-i):
+                self._follow_feed(feeds[j])
+
+        # make request to explore endpoint
+        self._do_logout()
+        url = "/api/explore/"
+        resp = self.client.get(url)
+
+        # assert that the feeds are sorted
+        # from most followers to least followers
+        for i in range(4):
+            self.assertEqual(resp.data["feeds"][i]["name"], str(i))
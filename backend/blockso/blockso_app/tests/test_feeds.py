@@ -0,0 +1,657 @@
+# std lib imports
+import json
+
+# third party imports
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test.client import MULTIPART_CONTENT, encode_multipart, BOUNDARY
+import eth_account
+import responses
+import rq
+
+# our imports
+from ._base import BaseTest
+from ..models import Feed, Profile
+from .. import alchemy
+
+
+class FeedTests(BaseTest):
+    """
+    Test behavior around Feeds.
+    """
+
+    prelogin = True
+
+    def test_get_feed(self):
+        """
+        Assert that any user can get a specific feed.
+        """
+        # set up test
+        # create a post by user1 and user2
+        self._create_post()
+        self._force_login(self.test_signer_2)
+        self._create_post()
+        # create a Feed and add users 1 and 2 it
+        resp = self._create_feed()
+        feed = Feed.objects.get(pk=resp.data["id"])
+        feed.following.set(Profile.objects.all())
+
+        # make a request as an unauthenticated user to
+        # get the posts of the created Feed
+        self._do_logout()
+        url = f"/api/feeds/{feed.id}/items/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 2)
+        self.assertEqual(
+            resp.data["results"][0]["author"]["address"],
+            self.test_signer_2.address
+        )
+        self.assertEqual(
+            resp.data["results"][1]["author"]["address"],
+            self.test_signer.address
+        )
+
+    def test_list_feeds(self):
+        """
+        Assert that any user can list all Feeds.
+        """
+        # set up test
+        # create two feeds
+        self._create_feed()
+        self._create_feed()
+
+        # make request to list feeds
+        url = "/api/feeds/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 2)
+
+    def test_list_feeds_followed_by_me(self):
+        """
+        Assert that an authenticated user can list feeds they follow.
+        """
+        # set up test
+        # create two feeds as user 1
+        # they are automatically followed by the creator
+        self._create_feed()
+        self._create_feed()
+
+        # create a third feed by user 2
+        self._force_login(self.test_signer_2)
+        self._create_feed()
+
+        # make request as user 1
+        self._force_login(self.test_signer)
+        url = "/api/feeds/followed-by-me/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 2)
+
+        # assert feeds are returned in descending chronological order
+        self.assertEqual(resp.data["results"][0]["id"], 2)
+        self.assertEqual(resp.data["results"][1]["id"], 1)
+
+    def test_create_feed(self):
+        """
+        Assert that an authenticated user can create a Feed.
+        Assert that the feed is automatically followed by the creator.
+        """
+        # set up test
+        # login user
+
+        # make request to create feed
+        resp = self._create_feed(
+            name="My Feed",
+            description="An example of a feed!",
+        )
+
+        # make assertions
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(resp.data["name"], "My Feed")
+        self.assertEqual(
+            resp.data["owner"]["address"],
+            self.test_signer.address
+        )
+        self.assertEqual(resp.data["description"], "An example of a feed!")
+        self.assertEqual(resp.data["numFollowers"], 1)
+
+    def test_delete_feed(self):
+        """
+        Assert that the owner of a Feed can delete it.
+        """
+        # create feed
+        resp = self._create_feed()
+        feed = Feed.objects.get(pk=resp.data["id"])
+
+        # make request to delete it
+        url = f"/api/feeds/{feed.id}/"
+        resp = self.client.delete(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 204)
+
+    def test_delete_feed_not_owner(self):
+        """
+        Assert that a user cannot delete a Feed they do not own.
+        """
+        # create feed
+        resp = self._create_feed()
+        feed = Feed.objects.get(pk=resp.data["id"])
+
+        # make request to delete it from another user
+        self._force_login(self.test_signer_2)
+        url = f"/api/feeds/{feed.id}/"
+        resp = self.client.delete(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 403)
+
+    def test_update_feed(self):
+        """
+        Assert that the owner of a Feed can update its details.
+        """
+        # create a feed
+        resp = self._create_feed()
+        feed = Feed.objects.get(pk=resp.data["id"])
+
+        # make request to update its details
+        url = f"/api/feeds/{feed.id}/"
+        data = {
+            "name": "New Name",
+            "description": "New Description",
+            "image": "https://example.com/"
+        }
+        self.client.put(url, data)
+
+        # assert that feed has updated data
+        resp = self.client.get(url)
+        self.assertEqual(resp.data["id"], feed.id)
+        self.assertEqual(resp.data["name"], "New Name")
+        self.assertEqual(resp.data["description"], "New Description")
+
+    def test_update_feed_not_owner(self):
+        """
+        Assert that a random user cannot update the details of a Feed.
+        """
+        # create a feed
+        resp = self._create_feed()
+        feed = Feed.objects.get(pk=resp.data["id"])
+
+        # make request to update its details as another user
+        self._force_login(self.test_signer_2)
+        url = f"/api/feeds/{feed.id}/"
+        data = {"name":"", "description":"", "image":""}
+        resp = self.client.put(url, data)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 403)
+
+    def test_retrieve_feed(self):
+        """
+        Assert that retrieving a feed returns the correct data,
+        including number of followers, number of following, and
+        whether it is followed by the requesting user.
+        """
+        # mock out the request to alchemy
+        self.mock_responses.add(responses.PUT, alchemy.url)
+
+        # create feed
+        resp = self._create_feed()
+        feed_id = resp.data["id"]
+
+        # make feed follow a profile
+        self._add_feed_following(feed_id, self.test_signer_2.address) 
+
+        # make request to retrieve feed by the creator
+        url = f"/api/feeds/{feed_id}/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["numFollowing"], 1)
+        # feed is automatically followed by its creator
+        self.assertEqual(resp.data["numFollowers"], 1)
+        self.assertEqual(resp.data["followedByMe"], True)
+
+        # make request to retrieve feed by non-follower
+        self._force_login(self.test_signer_2)
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.data["followedByMe"], False)
+
+    def test_add_remove_feed_following(self):
+        """
+        Assert that a Feed owner can make the Feed follow a profile.
+        Assert that a Feed owner can make the Feed unfollow a profile.
+        """
+        # mock out the request to alchemy
+        self.mock_responses.add(responses.PUT, alchemy.url)
+
+        # create feed
+        resp = self._create_feed()
+        feed = Feed.objects.get(pk=resp.data["id"])
+
+        # make request to add user 2 to the feed's following
+        url = f"/api/feeds/{feed.id}/following/{self.test_signer_2.address}/"
+        resp = self.client.post(url)
+
+        # assert that the feed is now following the profile
+        self.assertTrue(
+            feed.following.filter(user_id=self.test_signer_2.address).exists()
+        )
+
+        # assert that a job was enqueued to fetch user 2's tx history
+        queue = rq.Queue(connection=self.redis_backend, name="high")
+        jobs = queue.get_job_ids()
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(jobs[0], self.test_signer_2.address)
+
+        # make request to remove user 2 from the feed's following
+        resp = self.client.delete(url)
+
+        # assert that the feed is no longer following the profile
+        self.assertFalse(
+            feed.following.filter(user_id=self.test_signer_2.address).exists()
+        )
+
+    def test_add_remove_feed_following_not_owner(self):
+        """
+        Assert that non-owners of Feeds cannot make the
+        Feed follow/unfollow a profile.
+        """
+        # mock out the request to alchemy
+        self.mock_responses.add(responses.PUT, alchemy.url)
+
+        # create feed
+        resp = self._create_feed()
+        feed = Feed.objects.get(pk=resp.data["id"])
+
+        # make request as a random user to add user 3 to the feed's following
+        self._force_login(self.test_signer_2)
+        user_3 = eth_account.Account.create()
+        url = f"/api/feeds/{feed.id}/following/{user_3.address}/"
+        resp = self.client.post(url)
+
+        # assert that the request failed and the feed is not following user3
+        self.assertEqual(resp.status_code, 403)
+        self.assertFalse(
+            feed.following.filter(user_id=user_3.address).exists()
+        )
+
+        # sign in as the feed owner and add user3 to the feed's following
+        self._force_login(self.test_signer)
+        self.client.post(url)
+
+        # sign in as non-owner and remove user3 from the feed's following
+        self._force_login(self.test_signer_2)
+        resp = self.client.delete(url)
+
+        # assert that the request failed and the feed is still following user3
+        self.assertEqual(resp.status_code, 403)
+        self.assertTrue(
+            feed.following.filter(user_id=user_3.address).exists()
+        )
+
+    def test_add_remove_feed_following_open_feed(self):
+        """
+        Assert that any authed user can make the Feed follow a profile,
+        if the feed is open to editing by the public.
+        Assert that any authed user can make the Feed unfollow a profile,
+        if the feed is open to editing by the public.
+        """
+        # mock out the request to alchemy
+        self.mock_responses.add(responses.PUT, alchemy.url)
+
+        # create feed
+        resp = self._create_feed(editable=True)
+        feed = Feed.objects.get(pk=resp.data["id"])
+
+        # make request as a random user to add user 3 to the feed's following
+        self._force_login(self.test_signer_2)
+        user_3 = eth_account.Account.create()
+        url = f"/api/feeds/{feed.id}/following/{user_3.address}/"
+        resp = self.client.post(url)
+
+        # assert that the feed is now following the profile
+        self.assertEqual(resp.status_code, 201)
+        self.assertTrue(
+            feed.following.filter(user_id=user_3.address).exists()
+        )
+
+        # make request to remove user 3 from the feed's following
+        resp = self.client.delete(url)
+
+        # assert that the feed is no longer following the profile
+        self.assertFalse(
+            feed.following.filter(user_id=user_3.address).exists()
+        )
+
+    def test_add_remove_feed_invalid_address(self):
+        """
+        Assert that adding an invalid address to a
+        feed's following returns a 400 BAD REQUEST.
+        """
+        # create feed
+        resp = self._create_feed(editable=True)
+        feed = Feed.objects.get(pk=resp.data["id"])
+
+        # make request
+        resp = self._add_feed_following(feed.id, "invalid-address")
+
+        # make assertions
+        self.assertEqual(resp.status_code, 400)
+
+    def test_list_feed_following(self):
+        """
+        Assert that a user can list the profiles that a feed is following.
+        """
+        # mock out the request to alchemy
+        self.mock_responses.add(responses.PUT, alchemy.url)
+
+        # create feed and make it follow user 2
+        resp = self._create_feed()
+        feed = Feed.objects.get(pk=resp.data["id"])
+        self._add_feed_following(feed.id, self.test_signer_2.address)
+
+        # make a request to list the profiles the feed is following
+        url = f"/api/feeds/{feed.id}/following/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 1)
+        self.assertEqual(
+            resp.data["results"][0]["address"],
+            self.test_signer_2.address
+        )
+
+    def test_list_feed_followers(self):
+        """
+        Assert that a user can list the profiles that follow a feed.
+        """
+        # create feed, it is followed automatically by the creator
+        resp = self._create_feed()
+        feed = Feed.objects.get(pk=resp.data["id"])
+
+        # make a request to list the profiles that follow the feed
+        url = f"/api/feeds/{feed.id}/followers/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 1)
+        self.assertEqual(
+            resp.data["results"][0]["address"],
+            self.test_signer.address
+        )
+
+    def test_list_feed_profiles_after_delete(self):
+        """
+        Assert that the cached lists of a feed's followers and
+        following are invalidated when the feed is deleted.
+        """
+        # mock out the request to alchemy
+        self.mock_responses.add(responses.PUT, alchemy.url)
+
+        # create feed, it is followed automatically by the creator
+        resp = self._create_feed()
+        feed_id = resp.data["id"]
+        self._add_feed_following(feed_id, self.test_signer.address)
+
+        # list the feed's followers and following, caching them
+        urls = [
+            f"/api/feeds/{feed_id}/followers/",
+            f"/api/feeds/{feed_id}/following/"
+        ]
+        for url in urls:
+            resp = self.client.get(url)
+            self.assertEqual(resp.data["count"], 1)
+
+        # delete the feed
+        resp = self.client.delete(f"/api/feeds/{feed_id}/")
+        self.assertEqual(resp.status_code, 204)
+
+        # assert that the lists are not served from the cache
+        for url in urls:
+            resp = self.client.get(url)
+            self.assertEqual(resp.status_code, 404)
+
+    def test_list_feeds_owned_or_editable(self):
+        """
+        Assert that an authenticated user can list feeds they own,
+        or that are editable by public.
+        """
+        # set up test
+        # create two feeds as user 2
+        # one of them is editably by public
+        self._force_login(self.test_signer_2)
+        self._create_feed(editable=True)
+        self._create_feed(editable=False)
+
+        # create a feed owned by user 1
+        self._force_login(self.test_signer)
+        self._create_feed()
+
+        # make request as user 1 to list feeds that are owned or editable
+        url = f"/api/feeds/owned-or-editable/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.data["count"], 2)
+        self.assertEqual(
+            resp.data["results"][0]["owner"]["address"],
+            self.test_signer.address
+        )
+        self.assertEqual(
+            resp.data["results"][0]["followingEditableByPublic"],
+            False
+        )
+        self.assertEqual(
+            resp.data["results"][1]["owner"]["address"],
+            self.test_signer_2.address
+        )
+        self.assertEqual(
+            resp.data["results"][1]["followingEditableByPublic"],
+            True
+        )
+
+    def test_follow_unfollow_feed(self):
+        """
+        Assert that any user can follow a Feed.
+        Assert that any user can unfollow a Feed.
+        """
+        # create feed
+        resp = self._create_feed()
+        feed = Feed.objects.get(pk=resp.data["id"])
+
+        # make request to follow it as another user
+        self._force_login(self.test_signer_2)
+        url = f"/api/feeds/{feed.id}/follow/"
+        resp = self.client.post(url)
+
+        # assert that the user is now following the feed 
+        self.assertTrue(
+            feed.followers.filter(user_id=self.test_signer_2.address).exists()
+        )
+
+        # make request to unfollow the feed
+        resp = self.client.delete(url)
+
+        # assert that the user is no longer following the feed 
+        self.assertFalse(
+            feed.followers.filter(user_id=self.test_signer_2.address).exists()
+        )
+
+    def test_list_feed_items(self):
+        """
+        Assert that any user can list a Feed's items.
+        """
+        # mock out the request to alchemy
+        self.mock_responses.add(responses.PUT, alchemy.url)
+
+        # create 2 users and make them create 1 post each
+        self._create_post()
+        self._force_login(self.test_signer_2)
+        self._create_post()
+
+        # create a feed and make it follow users 1 and 2
+        resp = self._create_feed()
+        feed_id = resp.data["id"]
+        self._add_feed_following(feed_id, self.test_signer.address)
+        self._add_feed_following(feed_id, self.test_signer_2.address)
+
+        # make a request as an anonymous user to list the items of the feed
+        url = f"/api/feeds/{feed_id}/items/"
+        self._do_logout()
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 2)
+
+    def test_list_feeds_ordered_by_desc_chronological_order(self):
+        """
+        Assert that listing feeds is ordered by descending chronological order.
+        """
+        # create 2 feeds
+        resp = self._create_feed(name="First Feed")
+        first_id = resp.data["id"]
+        resp = self._create_feed(name="Second Feed")
+        second_id = resp.data["id"]
+
+        # make request to list feeds
+        url = f"/api/feeds/"
+        resp = self.client.get(url)
+
+        # assert that the ordering is correct
+        self.assertEqual(resp.data["results"][0]["name"], "Second Feed")
+        self.assertEqual(resp.data["results"][1]["name"], "First Feed")
+
+    def test_feed_following_includes_user(self):
+        """
+        Assert that a 200 is returned if the feed follows the given user.
+        Assert that a 404 if returned if the feed does not follow the user.
+        """
+        # setup
+        # mock out the request to alchemy
+        self.mock_responses.add(responses.PUT, alchemy.url)
+
+        # create a feed and add a user to the profiles it follows
+        resp = self._create_feed()
+        feed_id = resp.data["id"]
+        self._add_feed_following(feed_id, self.test_signer_2.address)
+
+        # make request
+        url = f"/api/feeds/{feed_id}/following/{self.test_signer_2.address}/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+
+        # remove the user from the feed's following
+        self.client.delete(url)
+
+        # make request
+        url = f"/api/feeds/{feed_id}/following/{self.test_signer_2.address}/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 404)
+
+    def test_update_feed_image(self):
+        """
+        Assert that the owner of a feed can update its image.
+        """
+        # set up test
+        self.mock_responses.add(
+            responses.POST,
+            f"{settings.NFT_STORAGE_API_URL}/upload",
+            body=json.dumps({"value": {"cid": "fakecid"}})
+        )
+
+        # create feed
+        resp = self._create_feed()
+        feed_id = resp.data['id']
+
+        # make request to upload image
+        url = f"/api/feeds/{feed_id}/image/"
+        fake_img = SimpleUploadedFile("test.jpg", b"", content_type="image/jpeg")
+        data = encode_multipart(data={"image": fake_img}, boundary=BOUNDARY)
+        resp = self.client.put(
+            url,
+            data,
+            content_type=MULTIPART_CONTENT
+        )
+
+        # make assertions
+        self.assertEqual(resp.status_code, 201)
+        self.assertIn("fakecid", resp.data["image"]) 
+
+    def test_update_feed_image_not_owned(self):
+        """
+        Assert that a user cannot delete another user's feed image.
+        """
+        # create feed as user 1
+        resp = self._create_feed()
+        feed_id = resp.data["id"]
+
+        # make request to update feed image as user 2
+        self._force_login(self.test_signer_2)
+        resp = self._create_feed_image(feed_id)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 403)
+        
+    def test_delete_feed_image(self):
+        """
+        Assert that deleting a feed owner can delete its image.
+        """
+        # set up test
+        self.mock_responses.add(
+            responses.POST,
+            f"{settings.NFT_STORAGE_API_URL}/upload",
+            body=json.dumps({"value": {"cid": "fakecid"}})
+        )
+        self.mock_responses.add(
+            responses.DELETE,
+            f"{settings.NFT_STORAGE_API_URL}/fakecid",
+        )
+
+        # create feed and image
+        resp = self._create_feed()
+        feed_id = resp.data["id"]
+        self._create_feed_image(feed_id)
+
+        # make request to delete feed image
+        url = f"/api/feeds/{feed_id}/image/"
+        resp = self.client.delete(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 204)
+        url = f"/api/feeds/{feed_id}/"
+        resp = self.client.get(url)
+        self.assertEqual(resp.data["image"], None)
+
+    def test_delete_feed_image_not_owned(self):
+        """
+        Assert that deleting a feed owner can delete its image.
+        """
+        # create feed as user 1
+        resp = self._create_feed()
+        feed_id = resp.data["id"]
+
+        # delete feed image as user 2
+        self._force_login(self.test_signer_2)
+        url = f"/api/feeds/{feed_id}/image/"
+        resp = self.client.delete(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 403)
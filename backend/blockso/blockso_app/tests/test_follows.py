@@ -0,0 +1,281 @@
+# std lib imports
+
+# third party imports
+from django.conf import settings
+import responses
+
+# our imports
+from ._base import BaseTest, UserModel
+from ..models import Follow, Profile, Socials
+from .. import alchemy
+
+
+class FollowTests(BaseTest):
+    """
+    Tests follow related behavior.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Runs once before all tests, inside the transaction of the class.
+        Creates users 1 and 2, without logging them in.
+        """
+        super().setUpTestData()
+
+        for signer in [cls.test_signer, cls.test_signer_2]:
+            user = UserModel.objects.create(ethereum_address=signer.address)
+            profile = Profile.objects.create(user=user)
+            Socials.objects.create(profile=profile)
+
+    def setUp(self):
+        """ Runs before each test. """
+
+        super().setUp()
+
+        # mock out the request to alchemy
+        self.mock_responses.add(responses.PUT, alchemy.url)
+
+    def test_follow(self):
+        """
+        Assert that a user can follow another.
+        """
+        # prepare test
+        # users 1 and 2 are created in setUpTestData
+        # make request for user 1 to follow user 2
+        self._force_login(self.test_signer)
+        url = f"/api/{self.test_signer_2.address}/follow/"
+        resp = self.client.post(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 201)
+        self.assertTrue(Follow.objects.filter(
+            src__user_id=self.test_signer.address,
+            dest__user_id=self.test_signer_2.address
+        ).exists())
+
+    def test_unfollow(self):
+        """
+        Assert that a user can unfollow another.
+        """
+        # prepare test
+        # log in user 1
+        self._force_login(self.test_signer)
+
+        # make request for user 1 to follow user 2
+        url = f"/api/{self.test_signer_2.address}/follow/"
+        resp = self.client.post(url)
+
+        # make request for user 1 to UNFOLLOW user 2
+        url = f"/api/{self.test_signer_2.address}/follow/"
+        resp = self.client.delete(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 204)
+        self.assertFalse(Follow.objects.filter(
+            src__user_id=self.test_signer.address,
+            dest__user_id=self.test_signer_2.address
+        ).exists())
+
+    def test_unfollow_invalid_address(self):
+        """
+        Assert that unfollowing an invalid address returns a 400.
+        """
+        # prepare test
+        # log in user 1 and follow user 2
+        self._force_login(self.test_signer)
+        self._follow_user(self.test_signer_2.address)
+
+        # make request for user 1 to UNFOLLOW an invalid address
+        url = "/api/0xnotanaddress/follow/"
+        resp = self.client.delete(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 400)
+
+    def test_unfollow_not_followed(self):
+        """
+        Assert that unfollowing a user that is not followed returns a 404.
+        """
+        # prepare test
+        # log in user 1
+        self._force_login(self.test_signer)
+
+        # make request for user 1 to follow then UNFOLLOW user 2
+        url = f"/api/{self.test_signer_2.address}/follow/"
+        self.client.post(url)
+        self.client.delete(url)
+
+        # make request for user 1 to UNFOLLOW user 2 again
+        resp = self.client.delete(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 404)
+
+    def test_get_followers_following(self):
+        """
+        Assert that a user can see who follows a user.
+        Assert that a user can see who a user follows.
+        """
+        # prepare test
+        # make user 2 follow user 1
+        self._force_login(self.test_signer_2)
+        self._follow_user(self.test_signer.address)
+
+        # make request to get followers of user 1
+        url = f"/api/{self.test_signer.address}/followers/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.data["results"]), 1)
+        self.assertEqual(
+            resp.data["results"][0]["address"],
+            self.test_signer_2.address
+        )
+        self.assertIsNone(resp.data["next"])
+
+        # make request to get following of user 2
+        url = f"/api/{self.test_signer_2.address}/following/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.data["results"]), 1)
+        self.assertEqual(
+            resp.data["results"][0]["address"],
+            self.test_signer.address
+        )
+        self.assertIsNone(resp.data["next"])
+
+    def test_get_followers_after_follow(self):
+        """
+        Assert that a cached list of followers is
+        invalidated when the user gains a follower.
+        """
+        # prepare test
+        # log in user 2
+        self._force_login(self.test_signer_2)
+
+        # get followers of user 1 before and after user 2 follows them
+        url = f"/api/{self.test_signer.address}/followers/"
+        resp_before = self.client.get(url)
+        self._follow_user(self.test_signer.address)
+        resp_after = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(len(resp_before.data["results"]), 0)
+        self.assertEqual(len(resp_after.data["results"]), 1)
+        self.assertEqual(
+            resp_after.data["results"][0]["address"],
+            self.test_signer_2.address
+        )
+
+    def test_get_followers_cached_per_host(self):
+        """
+        Assert that a cached list of followers is not served
+        to a request for the same path on another host, since
+        the cached pagination links contain the host.
+        """
+        # prepare test
+        # 21 users follow user 1, one more than fits on a page
+        dest = Profile.objects.get(user_id=self.test_signer.address)
+        profiles = self._bulk_create_profiles(20)
+        Follow.objects.bulk_create([
+            Follow(src=profile, dest=dest) for profile in profiles
+        ])
+        self._force_login(self.test_signer_2)
+        self._follow_user(self.test_signer.address)
+
+        # get the followers of user 1 through two hosts
+        url = f"/api/{self.test_signer.address}/followers/"
+        resp_1 = self.client.get(url, HTTP_HOST="testserver")
+        resp_2 = self.client.get(url, HTTP_HOST="localhost")
+
+        # make assertions
+        self.assertTrue(resp_1.data["next"].startswith("http://testserver/"))
+        self.assertTrue(resp_2.data["next"].startswith("http://localhost/"))
+
+    def test_get_followers_ordering(self):
+        """
+        Assert that the followers of a user are
+        ordered based on when they were followed,
+        from most recent to least recent.
+        """
+        # prepare test
+        # create 5 users and make them follow user 1
+        signers = self._create_users(5)
+        for i in range(1, len(signers)):
+            self._force_login(signers[i])
+            self._follow_user(signers[0].address)
+
+        # get the followers of user 1
+        url = f"/api/{signers[0].address}/followers/"
+        resp = self.client.get(url)
+
+        # assert that the followers are ordered by most recent
+        followers = resp.data["results"]
+        for i in range(len(followers)):
+            self.assertEqual(
+                followers[i]["address"],
+                signers[4-i].address
+            )
+
+    def test_get_following_ordering(self):
+        """
+        Assert that the following of a user
+        are ordered based on when they were followed
+        by the user, from most recent to least recent.
+        """
+        # prepare test
+        # create 5 users and make user 1 follow them all
+        signers = self._create_users(5)
+        self._force_login(signers[0])
+        for i in range(1, len(signers)):
+            self._follow_user(signers[i].address)
+
+        # get the following of user 1
+        url = f"/api/{signers[0].address}/following/"
+        resp = self.client.get(url)
+
+        # assert that the following are ordered by most recent
+        following = resp.data["results"]
+        for i in range(len(following)):
+            self.assertEqual(
+                following[i]["address"],
+                signers[4-i].address
+            )
+
+    def test_follow_update_alchemy_wh(self):
+        """
+        Assert that a request is made to update the addresses
+        in Alchemy Notify when a user is followed.
+        """
+        # create 5 users and log them in
+        expected = []
+        signers = self._create_users(5)
+        for i in range(len(signers)):
+            self._force_login(signers[i])
+            expected.append(signers[i].address)
+        
+        # set up a mock response that asserts that the request
+        # to alchemy was made with the expected parameters
+        self.mock_responses.replace(
+            responses.PUT,
+            alchemy.url,
+            match=[
+                responses.matchers.header_matcher(
+                    {"X-Alchemy-Token": settings.ALCHEMY_NOTIFY_TOKEN}
+                ),
+                responses.matchers.json_params_matcher(
+                    {
+                        "webhook_id": settings.ALCHEMY_WH_ID,
+                        "addresses": expected
+                    }
+                )
+            ]
+        )
+
+        # make user 1 follow user 2
+        self._force_login(signers[0])
+        self._follow_user(signers[1].address)
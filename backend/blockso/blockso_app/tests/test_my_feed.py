@@ -0,0 +1,195 @@
+# std lib imports
+from datetime import datetime, timedelta, timezone
+
+# third party imports
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+import responses
+
+# our imports
+from ._base import BaseTest, UserModel
+from ..models import Follow, Post, PostLike, Profile, Transaction
+from ..views import MyFeedList
+from .. import alchemy
+
+
+class MyFeedTests(BaseTest):
+    """
+    Test behavior around a user's feed.
+    """
+
+    def test_get_feed(self):
+        """
+        Assert that a logged in user can get a feed of posts.
+        """
+        # set up test
+        user = UserModel.objects.create(
+            ethereum_address=self.test_signer.address
+        )
+        Profile.objects.create(user=user)
+
+        # call the view directly, skipping the middleware
+        request = APIRequestFactory().get("/api/feed/")
+        force_authenticate(request, user=user)
+        resp = MyFeedList.as_view()(request)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 0)
+
+    def test_get_feed_does_not_follow_others(self):
+        """
+        Assert that if a user is not following anyone,
+        only their own posts will show up in their feed.
+        """
+        # set up test
+        self._force_login(self.test_signer)
+        resp = self._create_post()
+        expected_posts = [resp.data]
+
+        # make request to get a feed
+        url = "/api/feed/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["results"], expected_posts)
+
+    def test_get_feed_follows_others(self):
+        """
+        Assert that if a user is following others,
+        both their posts and those they follow will show up in their feed.
+        """
+        # set up test
+        # create user 2, and log in user 1
+        self._force_login(self.test_signer_2)
+        self._force_login(self.test_signer)
+        user_1 = Profile.objects.get(user_id=self.test_signer.address)
+        user_2 = Profile.objects.get(user_id=self.test_signer_2.address)
+
+        # user 1 follows user 2, and each creates a post
+        # user 2's post is older than user 1's
+        Follow.objects.create(src=user_1, dest=user_2)
+        now = datetime.now(timezone.utc)
+        Post.objects.bulk_create([
+            Post(
+                author=user_2,
+                created=now - timedelta(minutes=1),
+                isShare=False,
+                isQuote=False
+            ),
+            Post(author=user_1, created=now, isShare=False, isQuote=False)
+        ])
+
+        # get feed of user 1
+        url = "/api/feed/"
+        resp = self.client.get(url)
+
+        # assert user 1 feed has the posts of user 1 and user 2
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 2)
+        self.assertEqual(
+            resp.data["results"][0]["author"]["address"],
+            self.test_signer.address
+        )
+        self.assertEqual(
+            resp.data["results"][1]["author"]["address"],
+            self.test_signer_2.address
+        )
+
+    def test_get_feed_num_queries(self):
+        """
+        Assert that getting a feed takes the same number of
+        queries no matter how many posts are in it.
+        """
+        # set up test
+        # log in user 1
+        self._force_login(self.test_signer)
+        user_1 = Profile.objects.get(user_id=self.test_signer.address)
+        profiles = self._bulk_create_profiles(3)
+
+        def add_posts(profile):
+            """
+            Makes user 1 follow the given profile, the profile post
+            about a transaction, and user 1 like and repost that post.
+            """
+            Follow.objects.create(src=user_1, dest=profile)
+            tx = Transaction.objects.create(
+                chain_id=1,
+                tx_hash=f"0x{profile.id}",
+                block_signed_at=datetime.now(timezone.utc),
+                from_address=profile.user_id,
+                to_address=self.test_signer.address,
+                value="0"
+            )
+            post = Post.objects.create(
+                author=profile,
+                refTx=tx,
+                isShare=False,
+                isQuote=False
+            )
+            Post.objects.create(
+                author=user_1,
+                refPost=post,
+                isShare=True,
+                isQuote=False
+            )
+            PostLike.objects.create(post=post, liker=user_1)
+
+        # get the feed with the posts of one followed profile
+        url = "/api/feed/"
+        add_posts(profiles[0])
+        with CaptureQueriesContext(connection) as few_queries:
+            resp = self.client.get(url)
+        self.assertEqual(resp.data["count"], 2)
+
+        # get the feed with the posts of three followed profiles
+        add_posts(profiles[1])
+        add_posts(profiles[2])
+        with CaptureQueriesContext(connection) as more_queries:
+            resp = self.client.get(url)
+        self.assertEqual(resp.data["count"], 6)
+
+        # make assertions
+        self.assertEqual(len(more_queries), len(few_queries))
+        for post in resp.data["results"]:
+            if post["isShare"]:
+                self.assertEqual(post["refPost"]["numLikes"], 1)
+                self.assertTrue(post["refPost"]["likedByMe"])
+                self.assertTrue(post["refPost"]["repostedByMe"])
+                self.assertIsNotNone(post["refPost"]["refTx"])
+            else:
+                self.assertEqual(post["numReposts"], 1)
+                self.assertTrue(post["repostedByMe"])
+
+    def test_get_feed_follows_feeds(self):
+        """
+        Assert that if a user is following feeds,
+        the user's feed will include posts from the feeds they follow.
+        """
+        # set up test
+        # mock out the request to alchemy
+        self.mock_responses.add(responses.PUT, alchemy.url)
+
+        # create a feed by user 1 and make the feed follow user 1
+        self._force_login(self.test_signer)
+        resp = self._create_feed()
+        feed_id = resp.data["id"]
+        self._add_feed_following(feed_id, self.test_signer.address)
+
+        # create a post by user 1
+        self._create_post()
+
+        # make request by user 2 to follow the feed
+        self._force_login(self.test_signer_2)
+        self._follow_feed(feed_id)
+
+        # assert that user 1's post shows up in user 2' My Feed
+        url = f"/api/feed/"
+        resp = self.client.get(url) 
+        self.assertEqual(resp.data["count"], 1)
+        self.assertEqual(
+            resp.data["results"][0]["author"]["address"],
+            self.test_signer.address
+        )
@@ -0,0 +1,86 @@
+# std lib imports
+
+# third party imports
+from django.test import override_settings
+from rest_framework.test import APISimpleTestCase
+
+# our imports
+from ._base import TEST_CACHES
+
+
+@override_settings(CACHES=TEST_CACHES)
+class NoDBTests(APISimpleTestCase):
+    """
+    Tests of unauthenticated requests that are rejected
+    before the database is touched, so they run without
+    the transaction wrapping the database tests.
+    """
+
+    def test_auth_get_session_unauthenticated(self):
+        """
+        Assert that an un-authenticated user gets
+        a 403 when they GET /auth/session/.
+        """
+        # make request to session endpoint without logging in
+        url = f"/api/auth/session/"
+        resp = self.client.get(url)
+
+        # assert correct data
+        self.assertEqual(resp.status_code, 403)
+
+    def test_retrieve_user_unauthed(self):
+        """
+        Assert that a user cannot get their own info
+        if they are not logged in.
+        """
+        # make request
+        resp = self.client.get("/api/user/")
+
+        # assert 403
+        self.assertEqual(resp.status_code, 403)
+
+    def test_create_feed_unauthed(self):
+        """
+        Assert that an un-authenticated user cannot create a Feed.
+        """
+        # make request to create feed
+        url = "/api/feeds/"
+        data = {
+            "name": "",
+            "description": "",
+            "followingEditableByPublic": False
+        }
+        resp = self.client.post(url, data)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 403)
+
+    def test_get_notifs_unauthed(self):
+        """
+        Assert that a logged out user cannot get a list of notifications.
+        """
+        # make request for notifications
+        url = "/api/notifications/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 403)
+
+    def test_unauthed_alchemy_webhook_request(self):
+        """
+        Assert that an unauthenticated webhook requests fails.
+        """
+        # set up test
+        url = "/api/alchemy-notify-webhook/"
+        data={"fakekey":"fakeval"}
+        extra_headers = {"HTTP_X-Alchemy-Signature": "wrong-sig"}
+
+        # make request
+        resp = self.client.post(
+            url,
+            data=data,
+            **extra_headers
+        )
+
+        # make assertions
+        self.assertEqual(resp.status_code, 403)
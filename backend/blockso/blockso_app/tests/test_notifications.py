@@ -0,0 +1,417 @@
+# std lib imports
+
+# third party imports
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+import responses
+
+# our imports
+from ._base import BaseTest, UserModel
+from ..models import Notification
+from ..views import NotificationListUpdate
+from .. import alchemy
+
+
+class NotificationTests(BaseTest):
+    """
+    Test behavior around notifications.
+    """
+
+    prelogin = True
+    prelogin_2 = True
+
+    def test_get_notifs(self):
+        """
+        Assert that a logged in user can get a list of notifications.
+        """
+        # set up test
+        # user 1 was created when logging in, see setUpTestData
+        user = UserModel.objects.get(pk=self.test_signer.address)
+
+        # call the view directly, skipping the middleware
+        request = APIRequestFactory().get("/api/notifications/")
+        force_authenticate(request, user=user)
+        resp = NotificationListUpdate.as_view()(request)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["results"], [])
+
+    def test_comment_on_post_notifs(self):
+        """
+        Assert that a user gets a notification when
+        another user comments on their post.
+        """
+        # set up test
+        # user 1 creates a post
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # user 2 comments on user 1's post
+        self._create_comment(post_id, text="hello", client=self.client_2)
+
+        # make request to get user 1's notifications
+        url = "/api/notifications/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 1)
+        notification = resp.data["results"][0]
+        self.assertEqual(notification["viewed"], False)
+        event = notification["events"]["commentOnPostEvent"]
+        self.assertEqual(event["post"], post_id)
+        self.assertEqual(
+            event["commentor"]["address"],
+            self.test_signer_2.address
+        )
+
+    def test_mentioned_in_post_notif(self):
+        """
+        Assert that a user gets a notification when
+        another user mentions them in a post.
+        """
+        # set up test
+        # user 2 tags user 1 in a post
+        tagged = [self.test_signer.address]
+        resp = self._create_post(
+            tagged_users=tagged,
+            client=self.client_2
+        )
+        post_id = resp.data["id"]
+
+        # make request to get user 1's notifications
+        url = "/api/notifications/"
+        resp = self.client.get(url)
+
+        # assert that user 1 has a notification for post mention
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 1)
+        notification = resp.data["results"][0]
+        self.assertEqual(notification["viewed"], False)
+        event = notification["events"]["mentionedInPostEvent"]
+        self.assertEqual(event["post"], post_id)
+        self.assertEqual(
+            event["mentionedBy"]["address"],
+            self.test_signer_2.address
+        )
+
+    def test_mentioned_in_comment_notif(self):
+        """
+        Assert that a user gets a notification when
+        another user mentions them in a comment.
+        """
+        # set up test
+        # user 1 creates a post and a comment
+        # where they mention user 2
+        resp = self._create_post()
+        post_id = resp.data["id"]
+        self._create_comment(
+            post_id,
+            text="hello user 2",
+            tagged_users=[self.test_signer_2.address]
+        )
+
+        # make request to get user 2's notifications
+        url = "/api/notifications/"
+        resp = self.client_2.get(url)
+
+        # assert that user 2 has a notification for the comment mention
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 1)
+        notification = resp.data["results"][0]
+        self.assertEqual(notification["viewed"], False)
+        event = notification["events"]["mentionedInCommentEvent"]
+        self.assertEqual(event["post"], post_id)
+        self.assertEqual(
+            event["mentionedBy"]["address"],
+            self.test_signer.address
+        )
+
+    def test_follow_notif(self):
+        """
+        Assert that a user gets a notification when
+        another user follows them.
+        """
+        # set up test
+        self.mock_responses.add(responses.PUT, alchemy.url)
+        # user 2 follows user 1
+        self._follow_user(self.test_signer.address, client=self.client_2)
+
+        # make request to get user 1's notifications
+        url = "/api/notifications/"
+        resp = self.client.get(url)
+
+        # assert that user 1 has a notification for the follow
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 1)
+        notification = resp.data["results"][0]
+        self.assertEqual(notification["viewed"], False)
+        event = notification["events"]["followedEvent"]
+        self.assertEqual(
+            event["followedBy"]["address"],
+            self.test_signer_2.address
+        )
+
+    def test_mark_notifs_as_viewed(self):
+        """
+        Assert that a user can mark notification as viewed.
+        """
+        # set up test
+        # user 1 has two notifications
+        notif_ids = self._bulk_create_notifications(self.test_signer, 2)
+
+        # make request to mark notifications as viewed
+        url = "/api/notifications/"
+        data = {"notifications": notif_ids}
+        resp = self.client.put(url, data)
+
+        # assert that notifications are now viewed
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.data), len(notif_ids))
+        for notif in resp.data:
+            self.assertTrue(notif["viewed"])
+
+    def test_mark_notifs_as_viewed_order(self):
+        """
+        Assert that the notifications marked as viewed
+        are returned in the order they were requested.
+        """
+        # set up test
+        # user 1 has three notifications
+        notif_ids = self._bulk_create_notifications(self.test_signer, 3)
+        notif_ids = [notif_ids[1], notif_ids[2], notif_ids[0]]
+
+        # make request to mark notifications as viewed
+        url = "/api/notifications/"
+        data = {"notifications": notif_ids}
+        resp = self.client.put(url, data)
+
+        # assert that notifications keep the requested order
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual([notif["id"] for notif in resp.data], notif_ids)
+
+    def test_mark_notifs_as_viewed_not_found(self):
+        """
+        Assert that marking a notification that
+        does not exist as viewed returns a 404.
+        """
+        # set up test
+        # user 1 has a notification
+        notif_ids = self._bulk_create_notifications(self.test_signer, 1)
+
+        # make request to mark it and an unknown notification as viewed
+        url = "/api/notifications/"
+        data = {"notifications": notif_ids + [notif_ids[0] + 1000]}
+        resp = self.client.put(url, data)
+
+        # assert 404 and that no notification was marked as viewed
+        self.assertEqual(resp.status_code, 404)
+        self.assertFalse(
+            Notification.objects.filter(id__in=notif_ids, viewed=True)\
+                .exists()
+        )
+
+    def test_mark_notifs_as_viewed_string_ids(self):
+        """
+        Assert that notifications can be marked
+        as viewed using ids sent as strings.
+        """
+        # set up test
+        # user 1 has two notifications
+        notif_ids = self._bulk_create_notifications(self.test_signer, 2)
+
+        # make request to mark notifications as viewed
+        url = "/api/notifications/"
+        data = {"notifications": [str(notif_id) for notif_id in notif_ids]}
+        resp = self.client.put(url, data)
+
+        # assert that notifications are now viewed
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual([notif["id"] for notif in resp.data], notif_ids)
+        self.assertEqual(
+            Notification.objects.filter(id__in=notif_ids, viewed=True)\
+                .count(),
+            2
+        )
+
+    def test_mark_notifs_as_viewed_invalid_ids(self):
+        """
+        Assert that marking notifications as viewed
+        with ids that are not a list of numbers returns a 400.
+        """
+        # set up test
+        # user 1 has a notification
+        notif_ids = self._bulk_create_notifications(self.test_signer, 1)
+
+        # make requests with invalid notification ids
+        url = "/api/notifications/"
+        for notifications in [notif_ids[0], ["one"], [None], {}]:
+            data = {"notifications": notifications}
+            resp = self.client.put(url, data)
+
+            # assert 400
+            self.assertEqual(resp.status_code, 400)
+
+        # assert that the notification was not marked as viewed
+        self.assertFalse(
+            Notification.objects.filter(id__in=notif_ids, viewed=True)\
+                .exists()
+        )
+
+    def test_mark_notifs_as_viewed_unauthed(self):
+        """
+        Assert that an unauthenticated user
+        cannot mark notifications as viewed.
+        """
+        # set up test
+        # user 1 has a notification
+        notif_ids = self._bulk_create_notifications(self.test_signer, 1)
+
+        # make unauthenticated request to mark notifs as viewed
+        # with a client that never logged in
+        unauthed_client = self.client_class()
+        url = "/api/notifications/"
+        data = {"notifications": notif_ids}
+        resp = unauthed_client.put(url, data)
+
+        # assert 403
+        self.assertEqual(resp.status_code, 403)
+
+    def test_mark_notifs_as_viewed_for_others(self):
+        """
+        Assert that a user cannot mark
+        another user's notifications as viewed.
+        """
+        # set up test
+        # user 1 has a notification
+        notif_ids = self._bulk_create_notifications(self.test_signer, 1)
+
+        # make request as user 2 to mark user 1's notifications as viewed
+        url = "/api/notifications/"
+        data = {"notifications": notif_ids}
+        resp = self.client_2.put(url, data)
+
+        # assert that user 2 gets a 403
+        # and that the notifications were not marked as viewed
+        self.assertEqual(resp.status_code, 403)
+        self.assertFalse(
+            Notification.objects.filter(id__in=notif_ids, viewed=True)\
+                .exists()
+        )
+
+    def test_liked_your_post_notifs(self):
+        """
+        Assert that a user gets a notification when
+        another user likes their post.
+        """
+        # set up test
+        # user 1 creates a post
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # user 2 likes user 1's post
+        url = f"/api/post/{post_id}/likes/"
+        resp = self.client_2.post(url)
+
+        # assert that user 1 received a notification
+        url = "/api/notifications/"
+        resp = self.client.get(url)
+        notif = resp.data["results"][0]
+        event = notif["events"]["likedPostEvent"]
+        self.assertEqual(
+            event["likedBy"]["address"],
+            self.test_signer_2.address
+        )
+
+    def test_liked_your_comment_notifs(self):
+        """
+        Assert that a user gets a notification when
+        another user likes their comment.
+        """
+        # set up test
+        # user 1 creates a post and comment
+        resp = self._create_post()
+        post_id = resp.data["id"]
+        resp = self._create_comment(post_id, "hello")
+        comment_id = resp.data["id"]
+
+        # user 2 likes user 1's comment
+        url = f"/api/posts/{post_id}/comments/{comment_id}/likes/"
+        resp = self.client_2.post(url)
+
+        # assert that user 1 received a notification
+        url = "/api/notifications/"
+        resp = self.client.get(url)
+        notif = resp.data["results"][0]
+        event = notif["events"]["likedCommentEvent"]
+        self.assertEqual(
+            event["likedBy"]["address"],
+            self.test_signer_2.address
+        )
+        self.assertEqual(event["comment"], comment_id)
+        self.assertEqual(event["post"], post_id)
+
+    def test_list_notifs_num_queries(self):
+        """
+        Assert that listing notifications takes the same number of
+        queries no matter how many notifications there are.
+        """
+        # set up test
+        # user 2 comments on, likes, and reposts user 1's post
+        resp = self._create_post()
+        post_id = resp.data["id"]
+        self._create_comment(post_id, text="hello", client=self.client_2)
+        self.client_2.post(f"/api/post/{post_id}/likes/")
+        self._repost(post_id, client=self.client_2)
+
+        # list user 1's notifications
+        url = "/api/notifications/"
+        with CaptureQueriesContext(connection) as few_queries:
+            resp = self.client.get(url)
+        self.assertEqual(resp.data["count"], 3)
+
+        # user 2 comments on user 1's post a few more times
+        for text in ("friend", "how", "are", "you"):
+            self._create_comment(post_id, text=text, client=self.client_2)
+
+        # list user 1's notifications again
+        with CaptureQueriesContext(connection) as more_queries:
+            resp = self.client.get(url)
+        self.assertEqual(resp.data["count"], 7)
+
+        # make assertions
+        self.assertEqual(len(more_queries), len(few_queries))
+        for notif in resp.data["results"]:
+            events = [e for e in notif["events"].values() if e is not None]
+            self.assertEqual(len(events), 1)
+
+    def test_repost_notif(self):
+        """
+        Assert that a user gets a notification when
+        another user reposts their post.
+        """
+        # set up test
+        # create post by user 1
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # repost user1's post by user2
+        resp = self._repost(post_id, client=self.client_2)
+        repost_id = resp.data["id"]
+
+        # make request to get user 1's notifications
+        url = "/api/notifications/"
+        resp = self.client.get(url)
+
+        # assert that user 1 has a notification for the repost
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 1)
+        notification = resp.data["results"][0]
+        event = notification["events"]["repostEvent"]
+        self.assertEqual(event["repost"], repost_id)
+        self.assertEqual(
+            event["repostedBy"]["address"],
+            self.test_signer_2.address
+        )
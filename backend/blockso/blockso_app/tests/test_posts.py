@@ -0,0 +1,644 @@
+# std lib imports
+from datetime import datetime, timedelta, timezone
+
+# third party imports
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+import rq
+
+# our imports
+from ._base import BaseTest, get_test_signer
+from ..jobs import covalent_jobs
+from ..models import Post, Profile, Notification, MentionedInPostEvent
+from ..web3_client import w3
+
+
+class PostTests(BaseTest):
+    """
+    Test behavior around posts.
+    """
+
+    prelogin = True
+
+    def test_create_post(self):
+        """
+        Assert that a post is created successfully by a logged in user.
+        """
+        # set up test
+        # make request
+        resp = self._create_post()
+
+        # make assertions
+        self.assertEqual(resp.status_code, 201)
+
+    def test_get_post(self):
+        """
+        Assert that a post is retrieved successfully by any user.
+        """
+        # set up test
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # make request
+        url = f"/api/post/{post_id}/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+
+    def test_get_posts(self):
+        """
+        Assert that a list of a user's posts are
+        retrieved successfully by any user.
+        Assert that the posts are paginated by 20.
+        Assert that the posts are sorted in chronological
+        order from most recent to least recent.
+        """
+        # set up test
+        # create 25 posts
+        author = Profile.objects.get(user_id=self.test_signer.address)
+        base = datetime.now(timezone.utc)
+        times = [base + timedelta(hours=i) for i in range(1, 26)]
+        Post.objects.bulk_create([
+            Post(author=author, created=t, isShare=False, isQuote=False)
+            for t in times
+        ])
+
+        # make request
+        self._do_logout()
+        url = f"/api/{self.test_signer.address}/posts/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        results = resp.data["results"]
+        self.assertEqual(len(results), 20)  # 20 results
+
+        # assert chronological ordering
+        # the posts share their sub-second part, so their ISO times
+        # sort as strings in the same order as the times themselves
+        created = [result["created"] for result in results]
+        self.assertEqual(created, sorted(created, reverse=True))
+
+    def test_get_posts_queue_job(self):
+        """
+        Assert that a job is queued to fetch
+        the tx history of a profile when
+        fetching their posts.
+        Assert that jobs are only queued for profiles
+        that aren't being watched by Alchemy.
+        This means the profile has not logged in before
+        and is not on anybody's feed.
+        """
+        # set up test
+        # make request
+        # note that the signer never logged in here and
+        # therefore is not a user in the system
+        signer = get_test_signer(2)
+        url = f"/api/{signer.address}/posts/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+
+        # assert job to fetch tx history was added to the high queue
+        queue = rq.Queue(connection=self.redis_backend, name="high")
+        jobs = queue.get_job_ids()
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(jobs[0], signer.address)
+
+    def test_update_post(self):
+        """
+        Assert that a post is updated successfully.
+        Assert that the updated post is returned in the response.
+        """
+        # prepare test
+        resp = self._create_post()
+        post_id = resp.data["id"]
+        new_text = "My updated post."
+
+        # change some post info
+        update_data = {
+            **self.create_post_data,
+            "text": new_text,
+            "tagged_users": [self.test_signer.address]
+        }
+
+        # make PUT request
+        url = f"/api/post/{post_id}/"
+        resp = self.client.put(url, update_data)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["id"], post_id)
+        self.assertEqual(resp.data["text"], new_text)
+
+    def test_delete_post(self):
+        """
+        Assert that a post is deleted successfully.
+        """
+        # prepare test
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # delete the post
+        url = f"/api/post/{post_id}/"
+        resp = self.client.delete(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 204)
+        self.assertEqual(
+            Post.objects.filter(
+                author=Profile.objects.get(user_id=self.test_signer.address)
+            ).count(),
+            0
+        )
+
+    def test_get_post_ref_tx(self):
+        """
+        Assert that a post with a refTx will return
+        the details of the transaction in the serialized
+        post data response. 
+        """
+        # set up test
+        # create posts using the test covalent tx history API 
+        self._patch_tx_history(
+            self.test_signer.address,
+            self.erc20_tx_resp_parsed
+        )
+        covalent_jobs.process_address_txs(self.test_signer.address)
+
+        # assert that post 1 has a general reference transaction
+        url = "/api/post/1/"
+        resp = self.client.get(url)
+        self.assertEqual(
+            resp.data["refTx"]["tx_hash"],
+            "0x3a6db035bb71e695628860d6f488b9f8deaa72ce506eace855"\
+            "2a7c515346e323"
+        )
+
+        # assert that post 5 has a reference transaction
+        # that includes erc20 transfers
+        # refTx tied to them
+        url = "/api/post/5/"
+        resp = self.client.get(url)
+        self.assertEqual(
+            resp.data["refTx"]["tx_hash"],
+            "0x9fd2eb7db94cf71ddc665b48dad42e1d00d90ace525fd6a047"\
+            "9f958cce8a729f"
+        )
+        self.assertEqual(
+            resp.data["refTx"]["erc20_transfers"][0]["contract_address"],
+            w3.toChecksumAddress(
+                "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"
+            )
+        )
+
+    def test_get_post_num_queries(self):
+        """
+        Assert that getting a post takes the same number of queries
+        no matter how many transfers its transaction and its quoted
+        post's transaction have, or how many times it was reposted.
+        """
+        # set up test
+        # user 1 quotes a post, both refer to a transaction
+        # with one transfer of each kind
+        author = Profile.objects.get(user_id=self.test_signer.address)
+        post = self._bulk_create_tx_post(author, 1)
+        few_post = self._bulk_create_tx_post(author, 1, ref_post=post)
+
+        # user 1 quotes another post, both refer to a transaction
+        # with three transfers of each kind, and the quote is reposted
+        post = self._bulk_create_tx_post(author, 3)
+        more_post = self._bulk_create_tx_post(author, 3, ref_post=post)
+        Post.objects.bulk_create([
+            Post(author=author, refPost=more_post, isShare=True, isQuote=False)
+            for _ in range(3)
+        ])
+
+        # get both quotes
+        with CaptureQueriesContext(connection) as few_queries:
+            self.client.get(f"/api/post/{few_post.id}/")
+        with CaptureQueriesContext(connection) as more_queries:
+            resp = self.client.get(f"/api/post/{more_post.id}/")
+
+        # make assertions
+        self.assertEqual(len(more_queries), len(few_queries))
+        self.assertEqual(resp.data["numReposts"], 3)
+        self.assertEqual(len(resp.data["refTx"]["erc20_transfers"]), 3)
+        self.assertEqual(
+            len(resp.data["refPost"]["refTx"]["erc721_transfers"]),
+            3
+        )
+
+    def test_list_posts_ref_tx(self):
+        """
+        Assert that listing posts returns the same reference
+        transactions, including transfers, as retrieving each post.
+        """
+        # set up test
+        # create posts using the test covalent tx history API 
+        self._patch_tx_history(
+            self.test_signer.address,
+            self.erc20_tx_resp_parsed
+        )
+        covalent_jobs.process_address_txs(self.test_signer.address)
+
+        # list the user's posts
+        url = f"/api/{self.test_signer.address}/posts/"
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+
+        # assert that the listed transactions include transfers
+        self.assertTrue(any(
+            post["refTx"]["erc20_transfers"] for post in resp.data["results"]
+        ))
+
+        # assert that each listed post matches the retrieved post
+        for post in resp.data["results"]:
+            detail = self.client.get(f"/api/post/{post['id']}/")
+            self.assertEqual(post["refTx"], detail.data["refTx"])
+
+    def test_list_posts_nested_ref_tx(self):
+        """
+        Assert that listing posts returns the transfers of
+        transactions referred to by posts nested two levels deep.
+        """
+        # set up test
+        # user 1 quotes a post of another user that quotes another post,
+        # each referring to a transaction with two transfers of each kind
+        author = Profile.objects.get(user_id=self.test_signer.address)
+        other = self._bulk_create_profiles(1)[0]
+        post = self._bulk_create_tx_post(other, 2)
+        post = self._bulk_create_tx_post(other, 2, ref_post=post)
+        post = self._bulk_create_tx_post(author, 2, ref_post=post)
+
+        # list the user's posts
+        url = f"/api/{self.test_signer.address}/posts/"
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+
+        # assert that the innermost quoted transaction includes transfers
+        listed = resp.data["results"][0]
+        self.assertEqual(listed["id"], post.id)
+        ref_tx = listed["refPost"]["refPost"]["refTx"]
+        self.assertEqual(len(ref_tx["erc20_transfers"]), 2)
+        self.assertEqual(len(ref_tx["erc721_transfers"]), 2)
+
+        # assert that the listed post matches the retrieved post
+        detail = self.client.get(f"/api/post/{post.id}/")
+        self.assertEqual(listed["refPost"], detail.data["refPost"])
+
+    def test_get_num_comments(self):
+        """
+        Assert that a post includes the
+        number of comments on it.
+        """
+        # set up test
+        resp = self._create_post()
+        post_id = resp.data["id"]
+        self._create_comment(post_id, text="hello")
+        self._create_comment(post_id, text="world")
+
+        # get the post details
+        url = f"/api/post/{post_id}/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.data["numComments"], 2)
+
+    def test_get_post_pfp(self):
+        """
+        Assert that a post includes the
+        pfp of the author of the post.
+        """
+        # set up test
+        self._update_profile(self.test_signer)
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # make request
+        url = f"/api/post/{post_id}/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(
+            resp.data["author"]["image"],
+            self.update_profile_data["image"]
+        )
+
+    def test_tag_users_in_post(self):
+        """
+        Assert that a user can tag other users in a post.
+        """
+        # set up test
+        self._force_login(self.test_signer_2)
+
+        # make request
+        tagged = [self.test_signer.address]
+        resp = self._create_post(
+            tagged_users=tagged
+        )
+
+        # make assertions
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(
+            MentionedInPostEvent.objects.filter(
+                notification__user__user_id=self.test_signer.address
+            ).count(),
+            1
+        )
+
+    def test_tag_everyone_in_post(self):
+        """
+        Assert that a user can tag everyone in a post.
+        """
+        # set up test
+        # create 5 users
+        signers = self._create_users(5)
+        addresses = [signer.address for signer in signers]
+
+        # make request
+        self._force_login(signers[0])
+        tagged = ["everyone", addresses[1]]
+        resp = self._create_post(
+            tagged_users=tagged
+        )
+
+        # make assertions
+        self.assertEqual(resp.status_code, 201)
+
+        # assert that all users received notifications
+        notifs = Notification.objects.filter(user__user_id__in=addresses[1:])
+        self.assertEqual(notifs.count(), 4)
+        self.assertEqual(
+            MentionedInPostEvent.objects.filter(
+                notification__in=notifs
+            ).count(),
+            4
+        )
+
+        # assert that the post author did not receive a notification
+        self.assertEqual(
+            Notification.objects.filter(user__user_id=addresses[0]).count(),
+            0
+        )
+        self.assertEqual(
+            MentionedInPostEvent.objects.filter(
+                notification__user__user_id=addresses[0]
+            ).count(),
+            0
+        )
+
+    def test_like_unlike_post(self):
+        """
+        Assert that a user can like/unlike another user's post.
+        """
+        # set up test
+        # user 1 creates post
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # make request by user 2 to like user 1 post
+        url = f"/api/post/{post_id}/likes/"
+        self._force_login(self.test_signer_2)
+        resp = self.client.post(url)
+
+        # assert post was liked successfully
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(
+            resp.data["liker"]["address"],
+            self.test_signer_2.address
+        )
+
+        # make request by user 2 to unlike user 1 post
+        resp = self.client.delete(url)
+
+        # assert post was unliked successfully
+        resp = self.client.get(url)
+        self.assertEqual(resp.data["count"], 0)
+        self.assertEqual(resp.data["results"], [])
+
+    def test_like_post_twice(self):
+        """
+        Assert that a user cannot like a post twice.
+        """
+        # set up test
+        # user 1 creates post
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # make request by user 2 to like user 1's post twice
+        url = f"/api/post/{post_id}/likes/"
+        self._force_login(self.test_signer_2)
+        self.client.post(url)
+        resp = self.client.post(url)
+
+        # assert second like was unsuccessful
+        self.assertEqual(resp.status_code, 400)
+
+        # assert that total likes is 1
+        resp = self.client.get(url)
+        self.assertEqual(resp.data["count"], 1)
+        self.assertEqual(
+            resp.data["results"][0]["liker"]["address"], 
+            self.test_signer_2.address
+        )
+
+    def test_get_post_num_likes(self):
+        """
+        Assert that the number of likes a post has is returned
+        as part of the serialized Post data.
+        """
+        # set up test
+        # user 1 creates post
+        resp = self._create_post()
+        post_url = f"/api/post/{resp.data['id']}/"
+
+        # user 2 likes user 1's post
+        self._force_login(self.test_signer_2)
+        self.client.post(f"{post_url}likes/")
+
+        # make request to get the post
+        resp = self.client.get(post_url)
+        
+        # make assertions
+        self.assertEqual(resp.data["numLikes"], 1)
+
+    def test_get_post_liked_by_me(self):
+        """
+        Assert that likedByMe is True if the user liked the given post.
+        Assert that likedByMe is False otherwise.
+        """
+        # set up test
+        # user 1 creates post
+        resp = self._create_post()
+        post_url = f"/api/post/{resp.data['id']}/"
+
+        # user 2 likes user 1's post
+        self._force_login(self.test_signer_2)
+        self.client.post(f"{post_url}likes/")
+
+        # make request to get the post
+        resp = self.client.get(post_url)
+        
+        # make assertions
+        self.assertEqual(resp.data["likedByMe"], True)
+
+    def test_repost(self):
+        """
+        Assert that a user can repost another user's post.
+        """
+        # set up test
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # repost as user 2
+        self._force_login(self.test_signer_2)
+        resp = self._repost(post_id)
+
+        # assert that user 2 now has a post that references user 1's post
+        self.assertEqual(resp.status_code, 201)
+        new_post_id = resp.data["id"]
+        url = f"/api/post/{new_post_id}/"
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["refPost"]["id"], post_id)
+        self.assertEqual(
+            resp.data["refPost"]["author"]["address"],
+            self.test_signer.address
+        )
+        self.assertTrue(resp.data["isShare"])
+        self.assertFalse(resp.data["isQuote"])
+        self.assertIsNone(resp.data["refTx"])
+        self.assertEqual(resp.data["text"], "")
+        self.assertEqual(resp.data["imgUrl"], "")
+
+    def test_resposted_by_me_and_num_reposts(self):
+        """
+        Assert that 'respostedByMe' is True if the user
+        reposted the post in question.
+        Assert that 'numReposts' is correct.
+        """
+        # prepare test
+        # create post by user 1
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # repost as user 2
+        self._force_login(self.test_signer_2)
+        self._repost(post_id)
+
+        # make request to get original post as user 2
+        url = f"/api/post/{post_id}/"
+        resp = self.client.get(url)
+        
+        # assert that repostedByMe is True
+        self.assertTrue(resp.data["repostedByMe"])
+        # assert that numReposts is equal to 1
+        self.assertEqual(resp.data["numReposts"], 1)
+
+        # get feed of user 2
+        self._force_login(self.test_signer_2)
+        url = f"/api/feed/"
+        resp = self.client.get(url)
+
+        # assert that repostedByMe is True
+        self.assertEqual(resp.data["results"][0]["refPost"]["repostedByMe"], True)
+        # assert that numReposts is equal to 1
+        self.assertEqual(resp.data["results"][0]["refPost"]["numReposts"], 1)
+
+    def test_get_reposted_by_me_unauthed(self):
+        """
+        Assert that 'respostedByMe' is False if the
+        current user is not authenticated.
+        """
+        # prepare test
+        # create post by user 1
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # make request to get original post as unauthed user
+        self._do_logout()
+        url = f"/api/post/{post_id}/"
+        resp = self.client.get(url)
+        
+        # assert that repostedByMe is False
+        self.assertFalse(resp.data["repostedByMe"])
+
+    def test_cannot_repost_own_post(self):
+        """
+        Assert that a user cannot repost their own post.
+        """
+        # prepare test
+        # create post by user 1
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # try to repost it as user 1
+        resp = self._repost(post_id)
+
+        # assert 400 BAD REQUEST
+        self.assertEqual(resp.status_code, 400)
+
+    def test_cannot_repost_item_twice(self):
+        """
+        Assert that a user cannot repost an item twice.
+        """
+        # prepare test
+        # create post by user 1
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # repost it as user 2
+        self._force_login(self.test_signer_2)
+        self._repost(post_id)
+
+        # try to repost it again and
+        # assert 400 BAD REQUEST
+        resp = self._repost(post_id)
+        self.assertEqual(resp.status_code, 400)
+
+    def test_cannot_repost_a_repost(self):
+        """
+        Assert that a user cannot repost a repost.
+        """
+        # prepare test
+        # create post by user 1
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # repost it as user 2
+        self._force_login(self.test_signer_2)
+        resp = self._repost(post_id)
+        repost_id = resp.data["id"]
+
+        # repost the repost as user 1
+        self._force_login(self.test_signer)
+        resp = self._repost(repost_id)
+
+        # assert 400 BAD REQUEST
+        self.assertEqual(resp.status_code, 400)
+
+    def test_delete_repost(self):
+        """
+        Assert that a user can delete their repost.
+        """
+        # set up test
+        resp = self._create_post()
+        post_id = resp.data["id"]
+
+        # repost as user 2
+        self._force_login(self.test_signer_2)
+        resp = self._repost(post_id)
+        repost_id = resp.data["id"]
+
+        # make request to delete repost of original post_id
+        url = f"/api/post/{post_id}/repost/"
+        resp = self.client.delete(url)
+
+        # assert deletion was successful
+        self.assertEqual(resp.status_code, 204)
+        url = f"/api/post/{repost_id}/" 
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 404)
@@ -0,0 +1,156 @@
+# std lib imports
+
+# third party imports
+
+# our imports
+from ._base import BaseTest
+from ..models import Profile
+
+
+class ProfileTests(BaseTest):
+    """ Tests profile related behavior. """
+
+    prelogin = True
+
+    def test_create_profile(self):
+        """
+        Assert that a profile is created when a user signs in for the first time.
+        Assert that the created profile info is returned as JSON.
+        """
+        # prepare test and create profile
+        self._do_login(self.test_signer)
+        
+        # make assertions
+        url = f"/api/{self.test_signer.address}/profile/"
+        resp = self.client.get(url)
+        self.assertEqual(resp.data["address"], self.test_signer.address)
+        self.assertEqual(resp.data["image"], "")
+        self.assertEqual(resp.data["bio"], "")
+        self.assertIsNotNone(resp.data["lastLogin"])
+
+    def test_create_profile_invalid_address(self):
+        """
+        Assert that creating a profile for an invalid address returns a 400.
+        """
+        # prepare test
+        # make POST request with an address that is too short
+        url = f"/api/{self.test_signer.address[:-1]}/profile/"
+        resp = self.client.post(url, self.update_profile_data)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 400)
+
+    def test_update_profile(self):
+        """
+        Assert that a profile is updated successfully.
+        Assert that the updated profile info is returned as JSON.
+        """
+        # prepare test
+        # change some profile info
+        update_data = {
+            **self.update_profile_data,
+            "image": "https://ipfs.io/ipfs/nonexistent",
+            "bio": "short bio",
+            "socials": {
+                **self.update_profile_data["socials"],
+                "website": "https://newsite.com"
+            }
+        }
+
+        # make PUT request
+        url = f"/api/{self.test_signer.address}/profile/"
+        resp = self.client.put(url, update_data)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        profile = Profile.objects.get(user_id=self.test_signer.address)
+        expected = {
+            **update_data,
+            "address": self.test_signer.address,
+            "numFollowers": 0,
+            "numFollowing": 0,
+            "followedByMe": False,
+            "lastLogin": profile.user.last_login
+        }
+        self.assertDictEqual(resp.data, expected)
+
+    def test_retrieve_profile(self):
+        """
+        Assert that a profile is retrieved successfully.
+        """
+        # prepare test
+        self._update_profile(self.test_signer)
+
+        # make GET request
+        url = f"/api/{self.test_signer.address}/profile/"
+        resp = self.client.get(url)
+
+        # make assertions
+        self.assertEqual(resp.status_code, 200)
+        profile = Profile.objects.get(user_id=self.test_signer.address)
+        expected = {
+            **self.update_profile_data,
+            "address": self.test_signer.address,
+            "numFollowers": 0,
+            "numFollowing": 0,
+            "followedByMe": False,
+            "lastLogin": profile.user.last_login
+        }
+        self.assertDictEqual(resp.data, expected)
+
+    def test_retrieve_user(self):
+        """
+        Assert that a user can get their own info once logged in.
+        """
+        # prepare test
+        # make request
+        resp = self.client.get("/api/user/")
+
+        # make assertions
+        # assert that the user receives information about themselves
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(
+            resp.data["address"],
+            self.test_signer.address
+        )
+        self.assertIsNotNone(resp.data["profile"])
+        self.assertIsNotNone(resp.data["profile"]["lastLogin"])
+
+    def test_get_suggested_users(self):
+        """
+        Assert that users starting with the given
+        query are returned successfully.
+        """
+        # prepare test
+        self._do_logout()
+        self._force_login(self.test_signer_2)
+
+        # make request
+        # query using 0x + the first 3 characters of the address
+        query = self.test_signer.address[:5]
+        resp = self.client.get(f"/api/users/?q={query}")
+        
+        # assert 200
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.data["count"], 1)
+        self.assertEqual(
+            resp.data["results"][0]["address"],
+            self.test_signer.address
+        )
+
+    def test_get_suggested_users_pagination(self):
+        """
+        Assert that suggested users are paginated.
+        """
+        # prepare test
+        self._do_logout()
+        self._force_login(self.test_signer_2)
+
+        # make request
+        # query using an empty string to get all users
+        query = ""
+        resp = self.client.get(f"/api/users/?q={query}")
+        
+        # assert results are paginated
+        self.assertIn("results", resp.data)
+        self.assertIn("next", resp.data)
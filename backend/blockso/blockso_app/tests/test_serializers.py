@@ -0,0 +1,55 @@
+# std lib imports
+
+# third party imports
+from rest_framework.relations import ManyRelatedField
+from rest_framework.test import APISimpleTestCase
+
+# our imports
+from ..serializers import PostSerializer
+
+
+class SerializerTests(APISimpleTestCase):
+    """
+    Tests of serializer behavior that does not need the database.
+    """
+
+    def test_cached_fields_bound_per_instance(self):
+        """
+        Assert that two instances of the same serializer do not share
+        the nested serializers and many related fields copied from
+        the class's cached fields, so each is bound to its own instance.
+        """
+        # set up test
+        serializer_1 = PostSerializer()
+        serializer_2 = PostSerializer()
+
+        for serializer in [serializer_1, serializer_2]:
+            # nested serializers are bound to their own instance
+            author = serializer.fields["author"]
+            self.assertIs(author.parent, serializer)
+            self.assertIs(author.root, serializer)
+            socials = author.fields["socials"]
+            self.assertIs(socials.parent, author)
+            self.assertIs(socials.root, serializer)
+
+            # many related fields and their child are bound too
+            tagged_users = serializer.fields["tagged_users"]
+            self.assertIsInstance(tagged_users, ManyRelatedField)
+            self.assertIs(tagged_users.parent, serializer)
+            self.assertIs(tagged_users.child_relation.parent, tagged_users)
+            self.assertIs(tagged_users.child_relation.root, serializer)
+
+        # assert that the instances have their own copies
+        for name in ["author", "tagged_users"]:
+            self.assertIsNot(
+                serializer_1.fields[name],
+                serializer_2.fields[name]
+            )
+        self.assertIsNot(
+            serializer_1.fields["author"].fields["socials"],
+            serializer_2.fields["author"].fields["socials"]
+        )
+        self.assertIsNot(
+            serializer_1.fields["tagged_users"].child_relation,
+            serializer_2.fields["tagged_users"].child_relation
+        )
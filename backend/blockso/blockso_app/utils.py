@@ -3,13 +3,19 @@ Module containing functions commonly used
 in the blockso_app application.
 """
 # std lib imports
+import functools
+import re
 
 # third party imports
+from web3 import Web3
 
 # local imports
 from blockso_app.models import Feed, Profile
 
 
+ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+
 def get_profiles_to_watch():
     """
     Returns a list of profiles to watch.
@@ -26,3 +32,25 @@ def get_profiles_to_watch():
     profiles = logged_in | have_followers | on_feed
 
     return profiles
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_checksum_address(address):
+    """
+    Returns the checksum encoded version of the given valid address.
+    Results are memoized since the same addresses are checksummed
+    over and over, and each conversion hashes the address.
+    """
+    return Web3.toChecksumAddress(address)
+
+
+def to_checksum_address(address):
+    """
+    Returns the checksum encoded version of the given address.
+    Raises ValueError if the address is not a 0x prefixed hex address,
+    which is checked with a regex before any hashing is done.
+    """
+    if not ADDRESS_RE.fullmatch(address):
+        raise ValueError("Invalid address.")
+
+    return _to_checksum_address(address)
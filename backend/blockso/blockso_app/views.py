@@ -1,9 +1,8 @@
 # std lib imports
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import hashlib
 import hmac
 import json
-import pytz
 import secrets
 
 # third party imports
@@ -11,8 +10,8 @@ from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model, login, logout
 from django.db.models import Count
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.exceptions import ParseError, PermissionDenied, \
-    ValidationError
+from rest_framework.exceptions import NotFound, ParseError, \
+    PermissionDenied, ValidationError
 from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated, \
     IsAuthenticatedOrReadOnly
@@ -20,14 +19,14 @@ from rest_framework.response import Response
 from rest_framework import generics, mixins, status, views
 from siwe_auth.models import Nonce
 from siwe.siwe import SiweMessage
-from web3 import Web3
 import rq
 
 # our imports
 from .jobs import alchemy_jobs
 from .models import Comment, CommentLike, Feed, Follow, Notification, Post, \
         PostLike, Profile, Socials
-from . import alchemy, covalent, pagination, redis_client, serializers, utils
+from . import alchemy, cache, covalent, pagination, redis_client, \
+        serializers, utils
 
 
 UserModel = get_user_model()
@@ -79,8 +78,8 @@ def auth_nonce(request):
     https://github.com/payton/django-siwe-auth/blob/main/siwe_auth/views.py
     """
     # delete all expired nonce's
-    now = datetime.now(tz=pytz.UTC)
-    Nonce.objects.filter(expiration__lte=datetime.now(tz=pytz.UTC)).delete()
+    now = datetime.now(tz=timezone.utc)
+    Nonce.objects.filter(expiration__lte=now).delete()
 
     # create nonce, set it on the session, and return it to the user
     nonce = Nonce.objects.create(
@@ -176,23 +175,34 @@ class FollowCreateDestroy(
     permission_classes = [IsAuthenticated]
     serializer_class = serializers.FollowSerializer
 
-    def get_object(self):
+    def destroy(self, request, *args, **kwargs):
         """
-        Returns the object to be deleted.
+        Deletes the signed in user's Follow of the given address,
+        filtering on the followed address instead of fetching the
+        followed Profile first. Django still selects the matching
+        Follow before deleting it, since its FollowedEvent cascades
+        and delete signals are sent for it.
         """
         # get the signed in user
         user = self.request.user
         user = user.profile
 
-        # get address from the URL
+        # get address from the URL, return 400 if it is invalid
         address = self.kwargs["address"]
-        address = Web3.toChecksumAddress(address)
-        target = Profile.objects.get(user_id=address)
+        try:
+            address = utils.to_checksum_address(address)
+        except ValueError:
+            raise ValidationError("Invalid address.")
 
-        return Follow.objects.get(
+        # delete the follow, return 404 if there was nothing to delete
+        deleted, _ = Follow.objects.filter(
             src=user,
-            dest=target
-        )
+            dest__user_id=address
+        ).delete()
+        if deleted == 0:
+            raise NotFound("User does not follow the address.")
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
     def post(self, request, *args, **kwargs):
         """ Signed in user follows the given address. """
@@ -206,6 +216,7 @@ class FollowCreateDestroy(
 
 
 class FollowersList(
+    cache.CachedListMixin,
     mixins.ListModelMixin,
     generics.GenericAPIView):
 
@@ -224,6 +235,10 @@ class FollowersList(
         follow_src = Follow.objects.filter(dest=user)
         followers = Profile.objects.filter(follow_src__in=follow_src)
         followers = followers.order_by("-follow_src")
+        followers = self.get_serializer_class().setup_eager_loading(
+            followers,
+            self.request
+        )
 
         return followers
 
@@ -234,6 +249,7 @@ class FollowersList(
 
 
 class FollowingList(
+    cache.CachedListMixin,
     mixins.ListModelMixin,
     generics.GenericAPIView):
 
@@ -252,6 +268,10 @@ class FollowingList(
         follow_dest = Follow.objects.filter(src=user)
         following = Profile.objects.filter(follow_dest__in=follow_dest)
         following = following.order_by("-follow_dest")
+        following = self.get_serializer_class().setup_eager_loading(
+            following,
+            self.request
+        )
 
         return following
 
@@ -285,7 +305,7 @@ class ProfileCreateRetrieveUpdate(
         """
         # gets the user that is being searched
         # or creates it if it does not exist
-        address = Web3.toChecksumAddress(self.kwargs["address"])
+        address = utils.to_checksum_address(self.kwargs["address"])
         user, _ = UserModel.objects.get_or_create(
             ethereum_address=address
         )
@@ -383,6 +403,10 @@ class PostList(generics.ListAPIView):
         """
         author = Profile.objects.get(user_id=self.kwargs["address"])
         queryset = Post.objects.filter(author=author)
+        queryset = self.get_serializer_class().setup_eager_loading(
+            queryset,
+            self.request
+        )
         return queryset
 
     def get(self, request, *args, **kwargs):
@@ -390,7 +414,9 @@ class PostList(generics.ListAPIView):
         Returns a list of the user's posts.
         """
         # clean the address
-        self.kwargs["address"] = Web3.toChecksumAddress(self.kwargs["address"])
+        self.kwargs["address"] = utils.to_checksum_address(
+            self.kwargs["address"]
+        )
         address = self.kwargs["address"]
 
         # get the profile being searched or create it
@@ -411,10 +437,18 @@ class PostRetrieveUpdateDestroy(generics.RetrieveUpdateDestroyAPIView):
 
     permission_classes = [IsAuthenticatedOrReadOnly]
     serializer_class = serializers.PostSerializer
-    queryset = Post.objects.all()
     lookup_url_kwarg = "id"
     lookup_field = "id"
 
+    def get_queryset(self):
+        """
+        Return Posts eager loaded for the requestor.
+        """
+        return self.get_serializer_class().setup_eager_loading(
+            Post.objects.all(),
+            self.request
+        )
+
     def put(self, request, *args, **kwargs):
         """ Updates a Post with the given id. """
 
@@ -578,13 +612,18 @@ class ExploreList(views.APIView):
         The current implementation returns the top 8 profiles sorted
         from most followers to least followers.
         """
-        queryset = Profile.objects.annotate(
-            num_followers=Count('follow_dest')
+        queryset = serializers.ProfileSerializer.setup_eager_loading(
+            Profile.objects.all(),
+            self.request
         )
         queryset = queryset.order_by("-num_followers")
         queryset = queryset[:8]
 
-        return serializers.ProfileSerializer(queryset, many=True).data
+        return serializers.ProfileSerializer(
+            queryset,
+            many=True,
+            context={"request": self.request}
+        ).data
 
     def get(self, request, format=None):
         """
@@ -758,7 +797,7 @@ class FeedFollowCreateDestroy(
         return Response(status=status.HTTP_201_CREATED)
 
 
-class FeedFollowersList(generics.ListAPIView):
+class FeedFollowersList(cache.CachedListMixin, generics.ListAPIView):
 
     """ View that supports listing the followers of a Feed. """
 
@@ -770,9 +809,14 @@ class FeedFollowersList(generics.ListAPIView):
         Return Profiles that are followers of a Feed.
         Sorts the queryset in descending chronological order.
         """
-        # get followers of feed in question
-        queryset = Feed.objects.get(pk=self.kwargs["id"]).followers.all()
+        # get followers of feed in question, 404 if it does not exist
+        feed = generics.get_object_or_404(Feed, pk=self.kwargs["id"])
+        queryset = feed.followers.all()
         queryset = queryset.order_by("-id")
+        queryset = self.get_serializer_class().setup_eager_loading(
+            queryset,
+            self.request
+        )
 
         return queryset
 
@@ -816,7 +860,7 @@ class FeedFollowingCreateRetrieveDestroy(
         """ Retrieve whether the given user is in the Feed's following. """
     
         feed_id = self.kwargs["id"]
-        address = Web3.toChecksumAddress(self.kwargs["address"])
+        address = utils.to_checksum_address(self.kwargs["address"])
 
         feed = Feed.objects.get(pk=feed_id)
 
@@ -845,7 +889,7 @@ class FeedFollowingCreateRetrieveDestroy(
 
         # create the profile if needed
         try:
-            address = Web3.toChecksumAddress(self.kwargs["address"])
+            address = utils.to_checksum_address(self.kwargs["address"])
         except ValueError: 
             raise ParseError("Invalid address.")
 
@@ -866,7 +910,7 @@ class FeedFollowingCreateRetrieveDestroy(
         return Response(status=status.HTTP_201_CREATED, data=serializer.data)
 
 
-class FeedFollowingList(generics.ListAPIView):
+class FeedFollowingList(cache.CachedListMixin, generics.ListAPIView):
 
     """ View that supports listing the following of a Feed. """
 
@@ -878,9 +922,14 @@ class FeedFollowingList(generics.ListAPIView):
         Return Profiles that a Feed is following.
         Sorts the queryset in descending chronological order.
         """
-        # get following of feed in question
-        queryset = Feed.objects.get(pk=self.kwargs["id"]).following.all()
+        # get following of feed in question, 404 if it does not exist
+        feed = generics.get_object_or_404(Feed, pk=self.kwargs["id"])
+        queryset = feed.following.all()
         queryset = queryset.order_by("-id")
+        queryset = self.get_serializer_class().setup_eager_loading(
+            queryset,
+            self.request
+        )
 
         return queryset
 
@@ -903,6 +952,10 @@ class FeedItemsList(generics.ListAPIView):
         # get all posts by those users
         queryset = Post.objects.filter(author__in=profiles)
         queryset = queryset.order_by("-created")
+        queryset = self.get_serializer_class().setup_eager_loading(
+            queryset,
+            self.request
+        )
 
         return queryset
 
@@ -963,6 +1016,10 @@ class MyFeedList(generics.ListAPIView):
         # get all posts by those users
         queryset = Post.objects.filter(author__in=profiles)
         queryset = queryset.order_by("-created")
+        queryset = self.get_serializer_class().setup_eager_loading(
+            queryset,
+            self.request
+        )
 
         return queryset
 
@@ -991,6 +1048,7 @@ class NotificationListUpdate(
 
         # get all notifications for the user
         queryset = Notification.objects.filter(user=user.profile)
+        queryset = self.get_serializer_class().setup_eager_loading(queryset)
 
         return queryset
 
@@ -1003,23 +1061,37 @@ class NotificationListUpdate(
         """
         Updates the notifications of an authed user to be marked as viewed.
         User must own the notifications that are being updated.
-        Returns updated notifications.
+        Returns updated notifications, in the order they were requested.
         """
-        notif_ids = request.data["notifications"]
-        user = request.user
-        updated = []
+        # return 400 unless the notifications are a list of ids
+        notif_ids = request.data.get("notifications")
+        if not isinstance(notif_ids, list):
+            raise ValidationError("Notifications must be a list of ids.")
+        try:
+            notif_ids = [int(notif_id) for notif_id in notif_ids]
+        except (TypeError, ValueError):
+            raise ValidationError("Invalid Notification id.")
 
-        # mark all notifications as viewed
-        for notif_id in notif_ids:
-            notif = Notification.objects.get(id=notif_id)
+        notifs = Notification.objects.filter(id__in=notif_ids)
+        owners = dict(notifs.values_list("id", "user_id"))
 
-            # return 403 if trying to update somebody else's notification
-            if notif.user != user.profile:
-                raise PermissionDenied("User does not own the Notification.")
+        # return 404 if a notification does not exist
+        if any(notif_id not in owners for notif_id in notif_ids):
+            raise NotFound("Notification does not exist.")
 
-            notif.viewed = True
-            notif.save()
-            updated.append(notif)
+        # return 403 if trying to update somebody else's notification
+        if any(owner != request.user.profile.pk for owner in owners.values()):
+            raise PermissionDenied("User does not own the Notification.")
+
+        # mark all notifications as viewed in a single query
+        notifs.update(viewed=True)
+
+        # fetch the updated notifications, in the order they were requested
+        positions = {notif_id: i for i, notif_id in enumerate(notif_ids)}
+        updated = sorted(
+            self.get_queryset().filter(id__in=notif_ids),
+            key=lambda notif: positions[notif.id]
+        )
 
         serializer = serializers.NotificationSerializer(updated, many=True)
         return Response(serializer.data)
@@ -1038,7 +1110,10 @@ class CommentCreateList(generics.ListCreateAPIView):
         """
         Return Comments of the post specified in the url.
         """
-        return Comment.objects.filter(post__pk=self.kwargs["post_id"])
+        queryset = Comment.objects.filter(post__pk=self.kwargs["post_id"])
+        queryset = self.get_serializer_class().setup_eager_loading(queryset)
+
+        return queryset
 
 
 class CommentRetrieve(generics.RetrieveAPIView):
@@ -1055,4 +1130,7 @@ class CommentRetrieve(generics.RetrieveAPIView):
         """
         Return Comments of the post specified in the url.
         """
-        return Comment.objects.filter(post__pk=self.kwargs["post_id"])
+        queryset = Comment.objects.filter(post__pk=self.kwargs["post_id"])
+        queryset = self.get_serializer_class().setup_eager_loading(queryset)
+
+        return queryset
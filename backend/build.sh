@@ -22,7 +22,7 @@ cd blockso
 [ -f ".env" ] || cp ./sample-dev-env ./.env
 
 # run tests
-python manage.py test
+python manage.py test --parallel
 
 # run migrations
 python manage.py migrate